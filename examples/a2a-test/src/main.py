@@ -4,10 +4,10 @@ Licensed under the MIT License.
 """
 
 import asyncio
-import re
 import uuid
+from contextvars import ContextVar
 from os import getenv
-from typing import List, Union, cast
+from typing import List, Union
 
 from a2a.types import AgentCapabilities, AgentCard, AgentSkill, Message, Part, Role, TextPart
 from microsoft.teams.a2a import (
@@ -25,10 +25,14 @@ from microsoft.teams.ai import ChatPrompt, Function, ModelMessage
 from microsoft.teams.api import MessageActivity, TypingActivityInput
 from microsoft.teams.apps import ActivityContext, App, PluginBase
 from microsoft.teams.common import ConsoleLogger, ConsoleLoggerOptions
-from microsoft.teams.devtools import DevToolsPlugin
 from microsoft.teams.openai.completions_model import OpenAICompletionsAIModel
 from pydantic import BaseModel
 
+try:
+    from uvloop import new_event_loop as loop_factory
+except ImportError:  # uvloop is unavailable on Windows
+    loop_factory = None
+
 logger = ConsoleLogger().create_logger("a2a", ConsoleLoggerOptions(level="debug"))
 PORT = getenv("PORT", "4000")
 
@@ -60,7 +64,7 @@ prompt = ChatPrompt(
 
 def build_function_metadata(card: AgentCard) -> FunctionMetadata:
     return FunctionMetadata(
-        name=f"ask{re.sub(r'\s+', '', card.name)}",
+        name=f"ask{''.join(card.name.split())}",
         description=f"Ask {card.name} about {card.description or 'anything'}",
     )
 
@@ -84,11 +88,7 @@ def build_message_for_agent(data: BuildMessageForAgentMetadata) -> Union[Message
 
 def build_message_from_agent_response(data: BuildMessageFromAgentMetadata) -> str:
     if isinstance(data.response, Message):
-        text_parts: List[str] = []
-        for part in data.response.parts:
-            if getattr(part.root, "kind", None) == "text":
-                text_part = cast(TextPart, part.root)
-                text_parts.append(text_part.text)
+        text_parts = [part.root.text for part in data.response.parts if isinstance(part.root, TextPart)]
         return f"{data.card.name} says: {' '.join(text_parts)}"
     return f"{data.card.name} sent a non-text response."
 
@@ -145,37 +145,49 @@ class LocationParams(BaseModel):
 
 
 # Setup the A2A Server Plugin
-plugins: List[PluginBase] = [A2APlugin(A2APluginOptions(agent_card=agent_card)), DevToolsPlugin()]
+plugins: List[PluginBase] = [A2APlugin(A2APluginOptions(agent_card=agent_card))]
+# DevTools is opt-in so deployments do not start its server or import its package
+if getenv("TEAMS_DEVTOOLS") == "1":
+    from microsoft.teams.devtools import DevToolsPlugin
+
+    plugins.append(DevToolsPlugin())
 app = App(logger=logger, plugins=plugins)
 
 
+# Locations requested by the weather tool during the current A2A request
+requested_locations: ContextVar[List[str]] = ContextVar("requested_locations")
+
+
+async def location_handler(params: LocationParams) -> str:
+    requested_locations.get().append(params.location)
+    return f"The weather in {params.location} is sunny"
+
+
+# The weather prompt holds no per-request state, so it is built once and shared across requests
+weather_prompt = ChatPrompt(model=completions_model).with_function(
+    Function(
+        name="location",
+        description="The location to get the weather for",
+        parameter_schema=LocationParams,
+        handler=location_handler,
+    )
+)
+
+
 # A2A Server Event Handler
 async def my_event_handler(user_message: str) -> Union[Message, str]:
     logger.info(f"Received message: {user_message}")
-    tool_location = None
-
-    async def location_handler(params: LocationParams) -> str:
-        nonlocal tool_location
-        tool_location = params.location
-        return f"The weather in {params.location} is sunny"
-
-    result = (
-        await ChatPrompt(model=completions_model)
-        .with_function(
-            Function(
-                name="location",
-                description="The location to get the weather for",
-                parameter_schema=LocationParams,
-                handler=location_handler,
-            )
-        )
-        .send(user_message, instructions="You are a weather agent that can tell you the weather for a given location")
+    locations: List[str] = []
+    requested_locations.set(locations)
+
+    result = await weather_prompt.send(
+        user_message, instructions="You are a weather agent that can tell you the weather for a given location"
     )
 
-    if not tool_location:
+    if not locations:
         return Message(
             kind="message",
-            message_id=str(uuid.uuid4()),
+            message_id=uuid.uuid4().hex,
             role=Role("agent"),
             parts=[Part(root=TextPart(kind="text", text="Please provide a location"))],
         )
@@ -192,12 +204,9 @@ async def handle_a2a_message(message: A2AMessageEvent) -> None:
     logger.info(f"Received message: {request_context.message}")
 
     if request_context.message:
-        text_input = None
-        for part in request_context.message.parts:
-            if getattr(part.root, "kind", None) == "text":
-                text_part = cast(TextPart, part.root)
-                text_input = text_part.text
-                break
+        text_input = next(
+            (part.root.text for part in request_context.message.parts if isinstance(part.root, TextPart)), None
+        )
         if not text_input:
             await respond("My agent currently only supports text input")
             return
@@ -216,12 +225,11 @@ async def handler(message: str) -> ModelMessage:
 # A2A Client Message Handler
 @app.on_message
 async def handle_message(ctx: ActivityContext[MessageActivity]):
-    await ctx.reply(TypingActivityInput())
-
-    result = await handler(ctx.activity.text)
+    # Send the typing indicator while the prompt runs instead of before it
+    _, result = await asyncio.gather(ctx.reply(TypingActivityInput()), handler(ctx.activity.text))
     if result.content:
         await ctx.send(result.content)
 
 
 if __name__ == "__main__":
-    asyncio.run(app.start())
+    asyncio.run(app.start(), loop_factory=loop_factory)
@@ -4,7 +4,7 @@ Licensed under the MIT License.
 """
 
 from .citations import handle_citations_demo
-from .function_calling import handle_multiple_functions, handle_pokemon_search
+from .function_calling import close_pokemon_session, handle_multiple_functions, handle_pokemon_search
 from .memory_management import handle_stateful_conversation
 from .plugins import LoggingAIPlugin
 
@@ -14,4 +14,5 @@ __all__ = [
     "handle_stateful_conversation",
     "handle_citations_demo",
     "LoggingAIPlugin",
+    "close_pokemon_session",
 ]
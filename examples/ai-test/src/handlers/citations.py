@@ -6,22 +6,27 @@ Licensed under the MIT License.
 from microsoft.teams.api import CitationAppearance, MessageActivity, MessageActivityInput
 from microsoft.teams.apps import ActivityContext
 
+# The demo documents never change, so their citation appearances are built once at import
+CITED_DOCS = (
+    CitationAppearance(name="Weather Documentation", abstract="Weather data shows sunny conditions across the region"),
+    CitationAppearance(
+        name="Pokemon Database", abstract="Comprehensive database of Pokemon characteristics and abilities"
+    ),
+    CitationAppearance(
+        name="AI Development Guide", abstract="Best practices for integrating AI into Teams applications"
+    ),
+)
 
-async def handle_citations_demo(ctx: ActivityContext[MessageActivity]) -> None:
-    """Demo citations functionality as shown in docs"""
-    cited_docs = [
-        {"title": "Weather Documentation", "content": "Weather data shows sunny conditions across the region"},
-        {"title": "Pokemon Database", "content": "Comprehensive database of Pokemon characteristics and abilities"},
-        {"title": "AI Development Guide", "content": "Best practices for integrating AI into Teams applications"},
-    ]
+RESPONSE_TEXT = (
+    "Here's some information with citations [1] about weather patterns,"
+    "[2] Pokemon data, and [3] AI development best practices."
+)
 
-    response_text = (
-        "Here's some information with citations [1] about weather patterns,"
-        "[2] Pokemon data, and [3] AI development best practices."
-    )
 
-    message_activity = MessageActivityInput(text=response_text).add_ai_generated()
-    for i, doc in enumerate(cited_docs):
-        message_activity.add_citation(i + 1, CitationAppearance(name=doc["title"], abstract=doc["content"]))
+async def handle_citations_demo(ctx: ActivityContext[MessageActivity]) -> None:
+    """Demo citations functionality as shown in docs"""
+    message_activity = MessageActivityInput(text=RESPONSE_TEXT).add_ai_generated()
+    for position, appearance in enumerate(CITED_DOCS, start=1):
+        message_activity.add_citation(position, appearance)
 
     await ctx.send(message_activity)
@@ -5,12 +5,15 @@ Licensed under the MIT License.
 
 import json
 import logging
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Deque, Dict, List
 
 from microsoft.teams.api.activities.invoke.message.submit_action import MessageSubmitActionInvokeActivity
 from microsoft.teams.apps import ActivityContext
 
+MAX_STORED_FEEDBACKS = 1000
+
 
 @dataclass
 class StoredFeedback:
@@ -19,7 +22,9 @@ class StoredFeedback:
     message_id: str
     likes: int = 0
     dislikes: int = 0
-    feedbacks: List[Dict[str, Any]] = field(default_factory=lambda: [])
+    comments_count: int = 0
+    # Only the most recent feedback entries are kept so long-lived messages do not grow without bound
+    feedbacks: Deque[Dict[str, Any]] = field(default_factory=lambda: deque(maxlen=MAX_STORED_FEEDBACKS))
 
 
 # Global storage for feedback (in production, use proper storage)
@@ -60,25 +65,18 @@ async def handle_feedback_submission(ctx: ActivityContext[MessageSubmitActionInv
         logger.warning(f"No replyToId found for messageId {activity.id}")
         return
 
-    existing_feedback = get_feedback_storage(activity.reply_to_id)
-
-    if not existing_feedback:
-        new_feedback = StoredFeedback(message_id=activity.reply_to_id)
-        stored_feedback_by_message_id[activity.reply_to_id] = new_feedback
-        existing_feedback = new_feedback
-
-    # Update feedback counts and store text feedback
-    likes_increment = 1 if reaction == "like" else 0
-    dislikes_increment = 1 if reaction == "dislike" else 0
-
-    updated_feedback = StoredFeedback(
-        message_id=existing_feedback.message_id,
-        likes=existing_feedback.likes + likes_increment,
-        dislikes=existing_feedback.dislikes + dislikes_increment,
-        feedbacks=[*existing_feedback.feedbacks, feedback_json],
+    existing_feedback = stored_feedback_by_message_id.setdefault(
+        activity.reply_to_id, StoredFeedback(message_id=activity.reply_to_id)
     )
 
-    stored_feedback_by_message_id[activity.reply_to_id] = updated_feedback
+    # Update feedback counts and store text feedback
+    if reaction == "like":
+        existing_feedback.likes += 1
+    elif reaction == "dislike":
+        existing_feedback.dislikes += 1
+    existing_feedback.feedbacks.append(feedback_json)
+    if feedback_json.get("feedbackText"):
+        existing_feedback.comments_count += 1
 
     # Send confirmation response
     feedback_text: str = feedback_json.get("feedbackText", "")
@@ -95,12 +93,11 @@ def get_feedback_summary(message_id: str) -> str:
         return "No feedback collected yet."
 
     total_reactions = feedback.likes + feedback.dislikes
-    comments_count = len([f for f in feedback.feedbacks if f.get("feedbackText")])
 
     summary_parts: List[str] = []
     if total_reactions > 0:
         summary_parts.append(f"👍 {feedback.likes} likes, 👎 {feedback.dislikes} dislikes")
-    if comments_count > 0:
-        summary_parts.append(f"💬 {comments_count} comments")
+    if feedback.comments_count > 0:
+        summary_parts.append(f"💬 {feedback.comments_count} comments")
 
     return " | ".join(summary_parts) if summary_parts else "No feedback collected yet."
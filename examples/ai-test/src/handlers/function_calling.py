@@ -3,10 +3,12 @@ Copyright (c) Microsoft Corporation. All rights reserved.
 Licensed under the MIT License.
 """
 
+import asyncio
 import random
 from typing import Any, Dict
 
 import aiohttp
+from cachetools import TTLCache
 from microsoft.teams.ai import ChatPrompt, Function
 from microsoft.teams.ai.ai_model import AIModel
 from microsoft.teams.api import MessageActivity, MessageActivityInput
@@ -30,39 +32,111 @@ class GetWeatherParams(BaseModel):
     """The location to get weather for"""
 
 
+# Shared session so repeated lookups reuse pooled keep-alive connections to PokeAPI
+_poke_session: aiohttp.ClientSession | None = None
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    """Get the shared PokeAPI session, creating it on first use"""
+    global _poke_session
+    if _poke_session is None or _poke_session.closed:
+        _poke_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=60)
+        )
+    return _poke_session
+
+
+async def close_pokemon_session() -> None:
+    """Close the shared PokeAPI session"""
+    global _poke_session
+    if _poke_session is not None:
+        await _poke_session.close()
+        _poke_session = None
+
+
+# PokeAPI data is static, so formatted results are cached per pokemon name
+POKEMON_CACHE_MAX_SIZE = 512
+POKEMON_CACHE_TTL_SECONDS = 24 * 60 * 60
+_pokemon_cache: TTLCache[str, str] = TTLCache(maxsize=POKEMON_CACHE_MAX_SIZE, ttl=POKEMON_CACHE_TTL_SECONDS)
+
+# Locks for in-flight lookups with the number of requests holding or waiting on each
+_pokemon_locks: Dict[str, tuple[asyncio.Lock, int]] = {}
+
+
 async def pokemon_search_handler(params: SearchPokemonParams) -> str:
     """Search for Pokemon using PokeAPI - matches documentation example"""
+    pokemon_name = params.pokemon_name.lower()
+    cached = _pokemon_cache.get(pokemon_name)
+    if cached is not None:
+        return cached
+
+    # Concurrent lookups for the same pokemon wait for the first request instead of refetching.
+    # The lock is only dropped once no request holds or waits on it.
+    lock, users = _pokemon_locks.get(pokemon_name, (asyncio.Lock(), 0))
+    _pokemon_locks[pokemon_name] = (lock, users + 1)
+    try:
+        async with lock:
+            cached = _pokemon_cache.get(pokemon_name)
+            if cached is not None:
+                return cached
+            result = await _fetch_pokemon(params.pokemon_name, pokemon_name)
+            _pokemon_cache[pokemon_name] = result
+            return result
+    finally:
+        lock, users = _pokemon_locks[pokemon_name]
+        if users == 1:
+            del _pokemon_locks[pokemon_name]
+        else:
+            _pokemon_locks[pokemon_name] = (lock, users - 1)
+
+
+async def _fetch_pokemon(display_name: str, pokemon_name: str) -> str:
+    """Fetch and format a pokemon from PokeAPI"""
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"https://pokeapi.co/api/v2/pokemon/{params.pokemon_name.lower()}") as response:
-                if response.status != 200:
-                    raise ValueError(f"Pokemon '{params.pokemon_name}' not found")
+        session = await _get_session()
+        async with session.get(f"https://pokeapi.co/api/v2/pokemon/{pokemon_name}") as response:
+            if response.status != 200:
+                raise ValueError(f"Pokemon '{display_name}' not found")
 
-                data = await response.json()
+            data = await response.json()
 
-                result_data = {
-                    "name": data["name"],
-                    "height": data["height"],
-                    "weight": data["weight"],
-                    "types": [type_info["type"]["name"] for type_info in data["types"]],
-                }
+            result_data = {
+                "name": data["name"],
+                "height": data["height"],
+                "weight": data["weight"],
+                "types": [type_info["type"]["name"] for type_info in data["types"]],
+            }
 
-                return f"Pokemon {result_data['name']}: height={result_data['height']}, weight={result_data['weight']}, types={', '.join(result_data['types'])}"  # noqa: E501
+            return f"Pokemon {result_data['name']}: height={result_data['height']}, weight={result_data['weight']}, types={', '.join(result_data['types'])}"  # noqa: E501
     except Exception as e:
         raise ValueError(f"Error searching for Pokemon: {str(e)}") from e
 
 
+# Prompts hold no per-request state, so each one is built once per model and reused.
+# Models are dataclasses and can't be hashed, so prompts are keyed by the model's id.
+_pokemon_prompts: Dict[int, ChatPrompt] = {}
+_weather_prompts: Dict[int, ChatPrompt] = {}
+
+
+def get_pokemon_prompt(model: AIModel) -> ChatPrompt:
+    """Get the shared Pokemon search prompt for a model"""
+    prompt = _pokemon_prompts.get(id(model))
+    if prompt is None:
+        prompt = ChatPrompt(model).with_function(
+            Function(
+                name="pokemon_search",
+                description="Search for pokemon information including height, weight, and types",
+                parameter_schema=SearchPokemonParams,
+                handler=pokemon_search_handler,
+            )
+        )
+        _pokemon_prompts[id(model)] = prompt
+    return prompt
+
+
 async def handle_pokemon_search(model: AIModel, ctx: ActivityContext[MessageActivity]) -> None:
     """Handle single function calling - Pokemon search"""
-    prompt = ChatPrompt(model)
-    prompt.with_function(
-        Function(
-            name="pokemon_search",
-            description="Search for pokemon information including height, weight, and types",
-            parameter_schema=SearchPokemonParams,
-            handler=pokemon_search_handler,
-        )
-    )
+    prompt = get_pokemon_prompt(model)
 
     chat_result = await prompt.send(
         input=ctx.activity.text, instructions="You are a helpful assistant that can look up Pokemon for the user."
@@ -98,28 +172,39 @@ def get_weather_handler(params: BaseModel) -> str:
     return f"The weather in {location} is {weather['condition']} with a temperature of {weather['temperature']}°F"
 
 
+def get_weather_prompt(model: AIModel) -> ChatPrompt:
+    """Get the shared location and weather prompt for a model"""
+    prompt = _weather_prompts.get(id(model))
+    if prompt is None:
+        prompt = (
+            ChatPrompt(model)
+            .with_function(
+                Function(
+                    name="get_user_location",
+                    description="Gets the location of the user",
+                    parameter_schema=GetLocationParams,
+                    handler=get_location_handler,
+                )
+            )
+            .with_function(
+                name="weather_search",
+                description="Search for weather at a specific location",
+                parameter_schema={
+                    "title": "GetWeatherParams",
+                    "type": "object",
+                    "properties": {"location": {"title": "Location", "type": "string"}},
+                    "required": ["location"],
+                },
+                handler=get_weather_handler,
+            )
+        )
+        _weather_prompts[id(model)] = prompt
+    return prompt
+
+
 async def handle_multiple_functions(model: AIModel, ctx: ActivityContext[MessageActivity]) -> None:
     """Handle multiple function calling - location then weather"""
-    prompt = ChatPrompt(model)
-
-    prompt.with_function(
-        Function(
-            name="get_user_location",
-            description="Gets the location of the user",
-            parameter_schema=GetLocationParams,
-            handler=get_location_handler,
-        )
-    ).with_function(
-        name="weather_search",
-        description="Search for weather at a specific location",
-        parameter_schema={
-            "title": "GetWeatherParams",
-            "type": "object",
-            "properties": {"location": {"title": "Location", "type": "string"}},
-            "required": ["location"],
-        },
-        handler=get_weather_handler,
-    )
+    prompt = get_weather_prompt(model)
 
     chat_result = await prompt.send(
         input=ctx.activity.text,
@@ -3,6 +3,10 @@ Copyright (c) Microsoft Corporation. All rights reserved.
 Licensed under the MIT License.
 """
 
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from microsoft.teams.ai import ChatPrompt, ListMemory
 from microsoft.teams.ai.ai_model import AIModel
 from microsoft.teams.api import MessageActivity, MessageActivityInput
@@ -13,46 +17,66 @@ from microsoft.teams.apps import ActivityContext
 # persistent store backed by a database or other storage solution
 conversation_store: dict[str, ListMemory] = {}
 
+# Turns within a conversation are serialized so concurrent messages do not interleave their history.
+# Each lock is stored with the number of turns holding or waiting on it, and dropped when that reaches zero.
+conversation_locks: dict[str, tuple[asyncio.Lock, int]] = {}
+
+# One prompt per model is shared by all conversations; each turn passes its own memory to send().
+# Models are dataclasses and can't be hashed, so prompts are keyed by the model's id.
+_prompts: dict[int, ChatPrompt] = {}
+
+
+@asynccontextmanager
+async def conversation_lock(conversation_id: str) -> AsyncIterator[None]:
+    """Hold the lock for a conversation, removing it once no other turn is waiting"""
+    lock, users = conversation_locks.get(conversation_id, (asyncio.Lock(), 0))
+    conversation_locks[conversation_id] = (lock, users + 1)
+    try:
+        async with lock:
+            yield
+    finally:
+        lock, users = conversation_locks[conversation_id]
+        if users == 1:
+            del conversation_locks[conversation_id]
+        else:
+            conversation_locks[conversation_id] = (lock, users - 1)
+
 
 def get_or_create_conversation_memory(conversation_id: str) -> ListMemory:
     """Get or create conversation memory for a specific conversation"""
-    if conversation_id not in conversation_store:
-        conversation_store[conversation_id] = ListMemory()
-    return conversation_store[conversation_id]
+    return conversation_store.setdefault(conversation_id, ListMemory())
 
 
 async def handle_stateful_conversation(model: AIModel, ctx: ActivityContext[MessageActivity]) -> None:
     """Example of stateful conversation handler that maintains conversation history"""
     print(f"Received message: {ctx.activity.text}")
 
-    # Retrieve existing conversation memory or initialize new one
-    memory = get_or_create_conversation_memory(ctx.activity.conversation.id)
-
-    # Get existing messages for logging
-    existing_messages = await memory.get_all()
-    print(f"Existing messages before sending to prompt: {len(existing_messages)} messages")
-
-    # Create prompt with conversation-specific memory
-    prompt = ChatPrompt(model, memory=memory)
+    async with conversation_lock(ctx.activity.conversation.id):
+        # Retrieve existing conversation memory or initialize new one
+        memory = get_or_create_conversation_memory(ctx.activity.conversation.id)
 
-    chat_result = await prompt.send(
-        input=ctx.activity.text, instructions="You are a helpful assistant that remembers our previous conversation."
-    )
+        prompt = _prompts.get(id(model))
+        if prompt is None:
+            prompt = _prompts[id(model)] = ChatPrompt(model)
 
-    if chat_result.response.content:
-        message = MessageActivityInput(text=chat_result.response.content).add_ai_generated()
-        await ctx.send(message)
-    else:
-        await ctx.reply("I did not generate a response.")
+        # Send with conversation-specific memory
+        chat_result = await prompt.send(
+            input=ctx.activity.text,
+            memory=memory,
+            instructions="You are a helpful assistant that remembers our previous conversation.",
+        )
 
-    # Log final message count
-    final_messages = await memory.get_all()
-    print(f"Messages after sending to prompt: {len(final_messages)} messages")
+        if chat_result.response.content:
+            message = MessageActivityInput(text=chat_result.response.content).add_ai_generated()
+            await ctx.send(message)
+        else:
+            await ctx.reply("I did not generate a response.")
 
 
 async def clear_conversation_memory(conversation_id: str) -> None:
     """Clear memory for a specific conversation"""
     if conversation_id in conversation_store:
-        memory = conversation_store[conversation_id]
-        await memory.set_all([])
+        async with conversation_lock(conversation_id):
+            memory = conversation_store[conversation_id]
+            await memory.set_all([])
         print(f"Cleared memory for conversation {conversation_id}")
@@ -5,11 +5,14 @@ Licensed under the MIT License.
 
 import asyncio
 import re
+import time
 from os import getenv
+from typing import Awaitable, Callable, Dict, List, Tuple
 
 from dotenv import find_dotenv, load_dotenv
 from handlers import (
     LoggingAIPlugin,
+    close_pokemon_session,
     handle_citations_demo,
     handle_multiple_functions,
     handle_pokemon_search,
@@ -21,13 +24,17 @@ from handlers.feedback_management import (
     initialize_feedback_storage,
 )
 from handlers.memory_management import clear_conversation_memory
-from microsoft.teams.ai import ChatPrompt
+from microsoft.teams.ai import AIModel, ChatPrompt
 from microsoft.teams.api import MessageActivity, MessageActivityInput
 from microsoft.teams.api.activities.invoke.message.submit_action import MessageSubmitActionInvokeActivity
-from microsoft.teams.apps import ActivityContext, App
-from microsoft.teams.devtools import DevToolsPlugin
+from microsoft.teams.apps import ActivityContext, App, PluginBase, StopEvent
 from microsoft.teams.openai import OpenAICompletionsAIModel, OpenAIResponsesAIModel
 
+try:
+    from uvloop import new_event_loop as loop_factory
+except ImportError:  # uvloop is unavailable on Windows
+    loop_factory = None
+
 load_dotenv(find_dotenv(usecwd=True))
 
 
@@ -43,7 +50,14 @@ AZURE_OPENAI_MODEL = get_required_env("AZURE_OPENAI_MODEL")
 # Global plugin instance for tracking
 plugin_instance = LoggingAIPlugin()
 
-app = App(plugins=[DevToolsPlugin()])
+plugins: List[PluginBase] = []
+# DevTools is opt-in so deployments do not start its server or import its package
+if getenv("TEAMS_DEVTOOLS") == "1":
+    from microsoft.teams.devtools import DevToolsPlugin
+
+    plugins.append(DevToolsPlugin())
+
+app = App(plugins=plugins)
 
 # Models for different AI approaches
 completions_model = OpenAICompletionsAIModel(
@@ -55,115 +69,163 @@ responses_model = OpenAIResponsesAIModel(
     stateful=True,
 )
 
-# Global state
-current_model = completions_model
+# Selected model per conversation, so one user's switch does not retarget another conversation's prompts
+model_by_conversation: Dict[str, AIModel] = {}
+
+
+def get_current_model(ctx: ActivityContext[MessageActivity]) -> AIModel:
+    """Get the model selected for the current conversation"""
+    return model_by_conversation.get(ctx.activity.conversation.id, completions_model)
+
+
+# Plain prompts hold no per-request state, so one is built per model and reused.
+# Models are dataclasses and can't be hashed, so prompts are keyed by the model's id.
+prompts_by_model: Dict[int, ChatPrompt] = {}
+
+
+def get_prompt(model: AIModel) -> ChatPrompt:
+    """Get the shared plain prompt for a model"""
+    prompt = prompts_by_model.get(id(model))
+    if prompt is None:
+        prompt = prompts_by_model[id(model)] = ChatPrompt(model)
+    return prompt
+
+
+# Greetings always go to the completions model with the same instructions, so recent
+# responses are cached by the normalized greeting to skip the model round trip
+GREETING_INSTRUCTIONS = "You are a friendly assistant who talks like a pirate"
+GREETING_CACHE_TTL_SECONDS = 60 * 60
+greeting_response_cache: Dict[str, Tuple[float, str]] = {}
+
+
+async def send_cached_greeting(input: str) -> str | None:
+    """Send a greeting, reusing a recent response to the same greeting"""
+    key = input.strip().lower()
+    cached = greeting_response_cache.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    chat_result = await get_prompt(completions_model).send(input=input, instructions=GREETING_INSTRUCTIONS)
+    content = chat_result.response.content
+    if content:
+        greeting_response_cache[key] = (time.monotonic() + GREETING_CACHE_TTL_SECONDS, content)
+    return content
+
+
+CommandHandler = Callable[[ActivityContext[MessageActivity], str], Awaitable[bool]]
+
+# A command is the leading word, so "weather?", "citations." and tab or newline separated arguments still route
+COMMAND_PATTERN = re.compile(r"(\w+)(.*)", re.DOTALL)
+
+
+def split_command(text: str) -> Tuple[str, str]:
+    """Split text into its lowercased leading word and the stripped remainder"""
+    match = COMMAND_PATTERN.match(text.strip())
+    if match is None:
+        return "", text.strip()
+    return match.group(1).lower(), match.group(2).strip()
 
 
 # Simple chat handler (like TypeScript "hi" example)
-@app.on_message_pattern(re.compile(r"^hi$", re.IGNORECASE))
-async def handle_simple_chat(ctx: ActivityContext[MessageActivity]):
+async def handle_simple_chat(ctx: ActivityContext[MessageActivity], args: str) -> bool:
     """Handle 'hi' message with simple AI response"""
-    prompt = ChatPrompt(completions_model)
-    chat_result = await prompt.send(
-        input=ctx.activity.text, instructions="You are a friendly assistant who talks like a pirate"
-    )
+    if args:
+        return False
 
-    if chat_result.response.content:
-        message = MessageActivityInput(text=chat_result.response.content).add_ai_generated()
+    content = await send_cached_greeting(ctx.activity.text)
+
+    if content:
+        message = MessageActivityInput(text=content).add_ai_generated()
         await ctx.send(message)
+    return True
 
 
 # Command handlers (like TypeScript command pattern)
-@app.on_message_pattern(re.compile(r"^pokemon\s+(.+)", re.IGNORECASE))
-async def handle_pokemon_command(ctx: ActivityContext[MessageActivity]):
+async def handle_pokemon_command(ctx: ActivityContext[MessageActivity], args: str) -> bool:
     """Handle 'pokemon <name>' command"""
-    match = re.match(r"^pokemon\s+(.+)", ctx.activity.text, re.IGNORECASE)
-    if match:
-        pokemon_name = match.group(1).strip()
-        ctx.activity.text = pokemon_name  # Update activity text for handler
-        await handle_pokemon_search(current_model, ctx)
+    if not args:
+        return False
 
+    ctx.activity.text = args  # Update activity text for handler
+    await handle_pokemon_search(get_current_model(ctx), ctx)
+    return True
 
-@app.on_message_pattern(re.compile(r"^weather\b", re.IGNORECASE))
-async def handle_weather_command(ctx: ActivityContext[MessageActivity]):
+
+async def handle_weather_command(ctx: ActivityContext[MessageActivity], args: str) -> bool:
     """Handle 'weather' command with multiple functions"""
-    await handle_multiple_functions(current_model, ctx)
+    await handle_multiple_functions(get_current_model(ctx), ctx)
+    return True
 
 
 # Streaming handler (like TypeScript streaming example)
-@app.on_message_pattern(re.compile(r"^stream\s+(.+)", re.IGNORECASE))
-async def handle_streaming(ctx: ActivityContext[MessageActivity]):
+async def handle_streaming(ctx: ActivityContext[MessageActivity], args: str) -> bool:
     """Handle 'stream <query>' command"""
-    match = re.match(r"^stream\s+(.+)", ctx.activity.text, re.IGNORECASE)
-    if match:
-        query = match.group(1).strip()
-
-        prompt = ChatPrompt(current_model)
-        chat_result = await prompt.send(
-            input=query,
-            instructions="You are a friendly assistant who responds in extremely verbose language",
-            on_chunk=lambda chunk: ctx.stream.emit(chunk) if hasattr(ctx, "stream") else None,
-        )
-
-        if hasattr(ctx.activity.conversation, "is_group") and ctx.activity.conversation.is_group:
-            # Group chat - send final response
-            if chat_result.response.content:
-                message = MessageActivityInput(text=chat_result.response.content).add_ai_generated()
-                await ctx.send(message)
-        else:
-            # 1:1 chat - streaming handled above
-            if hasattr(ctx, "stream"):
-                ctx.stream.emit(MessageActivityInput().add_ai_generated())
+    if not args:
+        return False
+
+    chat_result = await get_prompt(get_current_model(ctx)).send(
+        input=args,
+        instructions="You are a friendly assistant who responds in extremely verbose language",
+        on_chunk=lambda chunk: ctx.stream.emit(chunk) if hasattr(ctx, "stream") else None,
+    )
+
+    if hasattr(ctx.activity.conversation, "is_group") and ctx.activity.conversation.is_group:
+        # Group chat - send final response
+        if chat_result.response.content:
+            message = MessageActivityInput(text=chat_result.response.content).add_ai_generated()
+            await ctx.send(message)
+    else:
+        # 1:1 chat - streaming handled above
+        if hasattr(ctx, "stream"):
+            ctx.stream.emit(MessageActivityInput().add_ai_generated())
+    return True
 
 
 # Utility commands
-@app.on_message_pattern(re.compile(r"^citations?\b", re.IGNORECASE))
-async def handle_citations_command(ctx: ActivityContext[MessageActivity]):
+async def handle_citations_command(ctx: ActivityContext[MessageActivity], args: str) -> bool:
     """Handle 'citations' command"""
     await handle_citations_demo(ctx)
+    return True
 
 
-@app.on_message_pattern(re.compile(r"^model\s*(.*)$", re.IGNORECASE))
-async def handle_model_switch(ctx: ActivityContext[MessageActivity]):
+async def handle_model_switch(ctx: ActivityContext[MessageActivity], args: str) -> bool:
     """Handle model switching"""
-    global current_model
-
-    match = re.match(r"^model\s*(.*)$", ctx.activity.text, re.IGNORECASE)
-    if match:
-        model_name = match.group(1).strip().lower()
-        if "completion" in model_name:
-            current_model = completions_model
-            await ctx.reply("🔄 Switched to **Chat Completions** model")
-        elif "response" in model_name:
-            current_model = responses_model
-            await ctx.reply("🔄 Switched to **Responses API** model")
-        else:
-            await ctx.reply(
-                f"📋 Current model: **{'completions' if current_model == completions_model else 'responses'}**"
-            )
-
-
-@app.on_message_pattern(re.compile(r"^plugin\b", re.IGNORECASE))
-async def handle_plugin_stats(ctx: ActivityContext[MessageActivity]):
+    conversation_id = ctx.activity.conversation.id
+    model_name = args.lower()
+    if "completion" in model_name:
+        model_by_conversation[conversation_id] = completions_model
+        await ctx.reply("🔄 Switched to **Chat Completions** model")
+    elif "response" in model_name:
+        model_by_conversation[conversation_id] = responses_model
+        await ctx.reply("🔄 Switched to **Responses API** model")
+    else:
+        current_model = get_current_model(ctx)
+        await ctx.reply(f"📋 Current model: **{'completions' if current_model == completions_model else 'responses'}**")
+    return True
+
+
+async def handle_plugin_stats(ctx: ActivityContext[MessageActivity], args: str) -> bool:
     """Handle 'plugin stats' command"""
     await ctx.reply(
         f"🔌 Plugin function calls so far: {', '.join(plugin_instance.function_calls) if plugin_instance.function_calls else 'None'}"  # noqa E501
     )
+    return True
 
 
-@app.on_message_pattern(re.compile(r"^memory\s+clear\b", re.IGNORECASE))
-async def handle_memory_clear(ctx: ActivityContext[MessageActivity]):
+async def handle_memory_command(ctx: ActivityContext[MessageActivity], args: str) -> bool:
     """Handle 'memory clear' command"""
+    if split_command(args)[0] != "clear":
+        return False
+
     await clear_conversation_memory(ctx.activity.conversation.id)
     await ctx.reply("🧠 Memory cleared!")
+    return True
 
 
 # Feedback demonstration
-@app.on_message_pattern(re.compile(r"^feedback\s+demo\b", re.IGNORECASE))
-async def handle_feedback_demo(ctx: ActivityContext[MessageActivity]):
+async def handle_feedback_demo(ctx: ActivityContext[MessageActivity], args: str) -> bool:
     """Handle 'feedback demo' command to demonstrate feedback collection"""
-    prompt = ChatPrompt(current_model)
-    chat_result = await prompt.send(
+    chat_result = await get_prompt(get_current_model(ctx)).send(
         input="Tell me a short joke", instructions="You are a comedian. Keep responses brief and funny."
     )
 
@@ -176,16 +238,54 @@ async def handle_feedback_demo(ctx: ActivityContext[MessageActivity]):
         if sent_message and hasattr(sent_message, "id"):
             initialize_feedback_storage(sent_message.id)
             await ctx.reply(f"💡 Feedback enabled! Try reacting or providing feedback. Message ID: {sent_message.id}")
+    return True
 
 
-@app.on_message_pattern(re.compile(r"^feedback\s+stats\s+(.+)", re.IGNORECASE))
-async def handle_feedback_stats(ctx: ActivityContext[MessageActivity]):
+async def handle_feedback_stats(ctx: ActivityContext[MessageActivity], args: str) -> bool:
     """Handle 'feedback stats <message_id>' command"""
-    match = re.match(r"^feedback\s+stats\s+(.+)", ctx.activity.text, re.IGNORECASE)
-    if match:
-        message_id = match.group(1).strip()
-        summary = get_feedback_summary(message_id)
-        await ctx.reply(f"📊 Feedback for message {message_id}: {summary}")
+    if not args:
+        return False
+
+    summary = get_feedback_summary(args)
+    await ctx.reply(f"📊 Feedback for message {args}: {summary}")
+    return True
+
+
+FEEDBACK_COMMANDS: Dict[str, CommandHandler] = {
+    "demo": handle_feedback_demo,
+    "stats": handle_feedback_stats,
+}
+
+
+async def handle_feedback_command(ctx: ActivityContext[MessageActivity], args: str) -> bool:
+    """Handle 'feedback demo' and 'feedback stats <message_id>' commands"""
+    subcommand, sub_args = split_command(args)
+    handler = FEEDBACK_COMMANDS.get(subcommand)
+    return handler is not None and await handler(ctx, sub_args)
+
+
+# Commands are routed by their first word, so a message costs one dict lookup instead of a regex per command
+COMMANDS: Dict[str, CommandHandler] = {
+    "hi": handle_simple_chat,
+    "pokemon": handle_pokemon_command,
+    "weather": handle_weather_command,
+    "stream": handle_streaming,
+    "citation": handle_citations_command,
+    "citations": handle_citations_command,
+    "model": handle_model_switch,
+    "plugin": handle_plugin_stats,
+    "memory": handle_memory_command,
+    "feedback": handle_feedback_command,
+}
+
+
+@app.on_message
+async def handle_message(ctx: ActivityContext[MessageActivity]):
+    """Dispatch commands, falling back to a stateful conversation (like TypeScript fallback)"""
+    command, args = split_command(ctx.activity.text)
+    handler = COMMANDS.get(command)
+    if handler is None or not await handler(ctx, args):
+        await handle_stateful_conversation(get_current_model(ctx), ctx)
 
 
 # Handle feedback submission events (like TypeScript message.submit.feedback)
@@ -195,12 +295,11 @@ async def handle_message_feedback(ctx: ActivityContext[MessageSubmitActionInvoke
     await handle_feedback_submission(ctx)
 
 
-# Fallback stateful conversation handler (like TypeScript fallback)
-@app.on_message
-async def handle_fallback(ctx: ActivityContext[MessageActivity]):
-    """Fallback handler for stateful conversation"""
-    await handle_stateful_conversation(current_model, ctx)
+@app.event("stop")
+async def handle_stop(event: StopEvent):
+    """Release shared HTTP connections when the app stops"""
+    await close_pokemon_session()
 
 
 if __name__ == "__main__":
-    asyncio.run(app.start())
+    asyncio.run(app.start(), loop_factory=loop_factory)
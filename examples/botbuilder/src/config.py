@@ -11,12 +11,19 @@ from dotenv import find_dotenv, load_dotenv
 SINGLE_TENANT = "singletenant"
 MULTI_TENANT = "multitenant"
 
+# Searching for the .env file walks up the directory tree, so it is done once at import
+# rather than every time a config is created. DOTENV_PATH loads a known file without the search,
+# and SKIP_DOTENV=1 skips .env loading when the environment is already provided.
+if os.getenv("DOTENV_PATH"):
+    load_dotenv(os.environ["DOTENV_PATH"])
+elif os.getenv("SKIP_DOTENV") != "1":
+    load_dotenv(find_dotenv(usecwd=True))
+
 
 class DefaultConfig:
     """Bot Configuration"""
 
     def __init__(self):
-        load_dotenv(find_dotenv(usecwd=True))
         self.PORT = os.getenv("PORT", "")
         self.APP_ID = os.getenv("CLIENT_ID", "")
         self.APP_PASSWORD = os.getenv("CLIENT_SECRET", "")
@@ -5,8 +5,7 @@ Licensed under the MIT License.
 
 import asyncio
 import datetime
-import sys
-import traceback
+from logging import Logger
 
 from botbuilder.core import TurnContext
 from botbuilder.integration.aiohttp import (
@@ -19,16 +18,23 @@ from config import DefaultConfig
 from microsoft.teams.api import MessageActivity
 from microsoft.teams.apps import ActivityContext, App
 from microsoft.teams.botbuilder import BotBuilderPlugin
+from microsoft.teams.common.logging import ConsoleLogger
 from microsoft.teams.devtools import DevToolsPlugin
 
+try:
+    from uvloop import new_event_loop as loop_factory
+except ImportError:  # uvloop is unavailable on Windows
+    loop_factory = None
+
+logger: Logger = ConsoleLogger().create_logger("@apps/botbuilder")
+
 config = DefaultConfig()
 adapter = CloudAdapter(ConfigurationBotFrameworkAuthentication(config))
 
 
 # Catch-all for errors.
 async def on_error(context: TurnContext, error: Exception):
-    print(f"\n [on_turn_error] unhandled error: {error}", file=sys.stderr)
-    traceback.print_exc()
+    logger.error("[on_turn_error] unhandled error: %s", error, exc_info=error)
 
     # Send a message to the user
     await context.send_activity("The bot encountered an error or bug.")
@@ -69,4 +75,4 @@ async def handle_message(ctx: ActivityContext[MessageActivity]):
 
 
 if __name__ == "__main__":
-    asyncio.run(app.start())
+    asyncio.run(app.start(), loop_factory=loop_factory)
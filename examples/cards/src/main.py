@@ -4,7 +4,9 @@ Licensed under the MIT License.
 """
 
 import asyncio
-from datetime import datetime
+from datetime import date
+from logging import Logger
+from typing import Any, Awaitable, Callable, Dict
 
 from microsoft.teams.api import AdaptiveCardInvokeActivity, MessageActivity, MessageActivityInput
 from microsoft.teams.api.models.adaptive_card import (
@@ -24,6 +26,14 @@ from microsoft.teams.cards import (
     ToggleInput,
 )
 from microsoft.teams.cards.core import Choice, ChoiceSetInput, DateInput, TextInput
+from microsoft.teams.common.logging import ConsoleLogger
+
+try:
+    from uvloop import new_event_loop as loop_factory
+except ImportError:  # uvloop is unavailable on Windows
+    loop_factory = None
+
+logger: Logger = ConsoleLogger().create_logger("@apps/cards")
 
 app = App()
 
@@ -45,56 +55,66 @@ def create_basic_adaptive_card() -> AdaptiveCard:
     return card
 
 
-def create_model_validate_card() -> AdaptiveCard:
-    """Create an adaptive card using model_validate to test deserialization."""
-    card = AdaptiveCard.model_validate(
+MODEL_VALIDATE_CARD_JSON = b"""
+{
+    "type": "AdaptiveCard",
+    "body": [
         {
-            "type": "AdaptiveCard",
-            "body": [
+            "type": "ColumnSet",
+            "columns": [
                 {
-                    "type": "ColumnSet",
-                    "columns": [
+                    "type": "Column",
+                    "verticalContentAlignment": "center",
+                    "items": [
                         {
-                            "type": "Column",
-                            "verticalContentAlignment": "center",
-                            "items": [
-                                {
-                                    "type": "Image",
-                                    "style": "Person",
-                                    "url": "https://aka.ms/AAp9xo4",
-                                    "size": "Small",
-                                    "altText": "Portrait of David Claux",
-                                }
-                            ],
-                            "width": "auto",
-                        },
+                            "type": "Image",
+                            "style": "Person",
+                            "url": "https://aka.ms/AAp9xo4",
+                            "size": "Small",
+                            "altText": "Portrait of David Claux"
+                        }
+                    ],
+                    "width": "auto"
+                },
+                {
+                    "type": "Column",
+                    "spacing": "medium",
+                    "verticalContentAlignment": "center",
+                    "items": [
                         {
-                            "type": "Column",
-                            "spacing": "medium",
-                            "verticalContentAlignment": "center",
-                            "items": [{"type": "TextBlock", "weight": "Bolder", "text": "David Claux", "wrap": True}],
-                            "width": "auto",
-                        },
+                            "type": "TextBlock",
+                            "weight": "Bolder",
+                            "text": "David Claux",
+                            "wrap": true
+                        }
+                    ],
+                    "width": "auto"
+                },
+                {
+                    "type": "Column",
+                    "spacing": "medium",
+                    "verticalContentAlignment": "center",
+                    "items": [
                         {
-                            "type": "Column",
-                            "spacing": "medium",
-                            "verticalContentAlignment": "center",
-                            "items": [
-                                {
-                                    "type": "TextBlock",
-                                    "text": "Principal Platform Architect at Microsoft",
-                                    "isSubtle": True,
-                                    "wrap": True,
-                                }
-                            ],
-                            "width": "stretch",
-                        },
+                            "type": "TextBlock",
+                            "text": "Principal Platform Architect at Microsoft",
+                            "isSubtle": true,
+                            "wrap": true
+                        }
                     ],
+                    "width": "stretch"
                 }
-            ],
-            "version": "1.5",
+            ]
         }
-    )
+    ],
+    "version": "1.5"
+}
+"""
+
+
+def create_model_validate_card() -> AdaptiveCard:
+    """Create an adaptive card using model_validate_json to test deserialization."""
+    card = AdaptiveCard.model_validate_json(MODEL_VALIDATE_CARD_JSON)
     return card
 
 
@@ -165,25 +185,29 @@ def create_feedback_card() -> AdaptiveCard:
     return card
 
 
-@app.on_message_pattern("card")
+# These cards never depend on the incoming activity, so they are built once and shared by every request
+BASIC_CARD = create_basic_adaptive_card()
+MODEL_VALIDATE_CARD = create_model_validate_card()
+PROFILE_CARD = create_profile_card()
+PROFILE_VALIDATION_CARD = create_profile_card_input_validation()
+FEEDBACK_CARD = create_feedback_card()
+
+
 async def handle_card_message(ctx: ActivityContext[MessageActivity]):
     """Handle card request messages."""
-    print(f"[CARD] Card requested by: {ctx.activity.from_}")
-    card = create_basic_adaptive_card()
-    await ctx.send(card)
+    logger.debug("[CARD] Card requested by: %s", ctx.activity.from_)
+    await ctx.send(BASIC_CARD)
 
 
-@app.on_message_pattern("json")
 async def handle_validate_card_message(ctx: ActivityContext[MessageActivity]):
     """Handle model validation card request messages."""
-    print(f"[VALIDATE] Model validate card requested by: {ctx.activity.from_}")
-    card = create_model_validate_card()
-    message = MessageActivityInput(text="Hello text!").add_card(card)
+    logger.debug("[VALIDATE] Model validate card requested by: %s", ctx.activity.from_)
+    message = MessageActivityInput(text="Hello text!").add_card(MODEL_VALIDATE_CARD)
     await ctx.send(message)
 
 
-@app.on_message_pattern("form")
-async def handle_form(ctx: ActivityContext[MessageActivity]):
+def create_task_form_card(due_date: date) -> AdaptiveCard:
+    """Create a task form card with the given default due date."""
     card = AdaptiveCard(
         schema="http://adaptivecards.io/schemas/adaptive-card.json",
         body=[
@@ -203,7 +227,7 @@ async def handle_form(ctx: ActivityContext[MessageActivity]):
             .with_id("priority")
             .with_label("Priority")
             .with_value("medium"),
-            DateInput(id="due_date").with_label("Due Date").with_value(datetime.now().strftime("%Y-%m-%d")),
+            DateInput(id="due_date").with_label("Due Date").with_value(due_date.isoformat()),
             ActionSet(
                 actions=[
                     ExecuteAction(title="Create Task")
@@ -214,109 +238,159 @@ async def handle_form(ctx: ActivityContext[MessageActivity]):
             ),
         ],
     )
+    return card
+
 
-    await ctx.send(card)
+# The form card only changes when the date does, so it is rebuilt at most once per day
+_task_form_card: tuple[date, AdaptiveCard] | None = None
+
+
+def get_task_form_card() -> AdaptiveCard:
+    """Get the task form card for today, rebuilding it when the date changes."""
+    global _task_form_card
+    today = date.today()
+    if _task_form_card is None or _task_form_card[0] != today:
+        _task_form_card = (today, create_task_form_card(today))
+    return _task_form_card[1]
+
+
+async def handle_form(ctx: ActivityContext[MessageActivity]):
+    """Handle task form card request messages."""
+    await ctx.send(get_task_form_card())
 
 
-@app.on_message_pattern("profile")
 async def handle_profile_card(ctx: ActivityContext[MessageActivity]):
     """Handle profile card request messages."""
-    print(f"[PROFILE] Profile card requested by: {ctx.activity.from_}")
-    card = create_profile_card()
-    await ctx.send(card)
+    logger.debug("[PROFILE] Profile card requested by: %s", ctx.activity.from_)
+    await ctx.send(PROFILE_CARD)
 
 
-@app.on_message_pattern("validation")
 async def handle_validation_card(ctx: ActivityContext[MessageActivity]):
     """Handle profile validation card request messages."""
-    print(f"[VALIDATION] Profile validation card requested by: {ctx.activity.from_}")
-    card = create_profile_card_input_validation()
-    await ctx.send(card)
+    logger.debug("[VALIDATION] Profile validation card requested by: %s", ctx.activity.from_)
+    await ctx.send(PROFILE_VALIDATION_CARD)
 
 
-@app.on_message_pattern("feedback")
 async def handle_feedback_card(ctx: ActivityContext[MessageActivity]):
     """Handle feedback card request messages."""
-    print(f"[FEEDBACK] Feedback card requested by: {ctx.activity.from_}")
-    card = create_feedback_card()
-    await ctx.send(card)
+    logger.debug("[FEEDBACK] Feedback card requested by: %s", ctx.activity.from_)
+    await ctx.send(FEEDBACK_CARD)
+
+
+async def submit_basic(ctx: ActivityContext[AdaptiveCardInvokeActivity], data: Dict[str, Any]) -> None:
+    notify_value = data.get("notify", "false")
+    await ctx.send(f"Basic card submitted! Notify setting: {notify_value}")
+
+
+async def submit_feedback(ctx: ActivityContext[AdaptiveCardInvokeActivity], data: Dict[str, Any]) -> None:
+    feedback_text = data.get("feedback", "No feedback provided")
+    await ctx.send(f"Feedback received: {feedback_text}")
+
+
+async def create_task(ctx: ActivityContext[AdaptiveCardInvokeActivity], data: Dict[str, Any]) -> None:
+    title = data.get("title", "Untitled")
+    priority = data.get("priority", "medium")
+    due_date = data.get("due_date", "No date")
+    await ctx.send(f"Task created!\nTitle: {title}\nPriority: {priority}\nDue: {due_date}")
+
+
+async def save_profile(ctx: ActivityContext[AdaptiveCardInvokeActivity], data: Dict[str, Any]) -> None:
+    entity_id = data.get("entity_id")
+    name = data.get("name", "Unknown")
+    email = data.get("email", "No email")
+    subscribe = data.get("subscribe", "false")
+    age = data.get("age")
+    location = data.get("location", "Not specified")
+
+    response_text = f"Profile saved!\nName: {name}\nEmail: {email}\nSubscribed: {subscribe}"
+    if entity_id:
+        response_text += f"\nEntity ID: {entity_id}"
+    if age:
+        response_text += f"\nAge: {age}"
+    if location != "Not specified":
+        response_text += f"\nLocation: {location}"
+
+    await ctx.send(response_text)
+
+
+CardActionHandler = Callable[[ActivityContext[AdaptiveCardInvokeActivity], Dict[str, Any]], Awaitable[None]]
+
+CARD_ACTIONS: Dict[str, CardActionHandler] = {
+    "submit_basic": submit_basic,
+    "submit_feedback": submit_feedback,
+    "create_task": create_task,
+    "save_profile": save_profile,
+}
+
+
+def create_bad_request_response(message: str) -> AdaptiveCardActionErrorResponse:
+    """Create a 400 card action response with the given error message."""
+    return AdaptiveCardActionErrorResponse(
+        status_code=400,
+        type="application/vnd.microsoft.error",
+        value=HttpError(
+            code="BadRequest",
+            message=message,
+            inner_http_error=InnerHttpError(
+                status_code=400,
+                body={"error": message},
+            ),
+        ),
+    )
+
+
+# Responses are only serialized after being returned, so the fixed ones are built once and shared
+NO_ACTION_RESPONSE = create_bad_request_response("No action specified")
+UNKNOWN_ACTION_RESPONSE = create_bad_request_response("Unknown action")
+ACTION_PROCESSED_RESPONSE = AdaptiveCardActionMessageResponse(
+    status_code=200,
+    type="application/vnd.microsoft.activity.message",
+    value="Action processed successfully",
+)
 
 
 @app.on_card_action
 async def handle_form_action(ctx: ActivityContext[AdaptiveCardInvokeActivity]) -> AdaptiveCardInvokeResponse:
     """Handle card action submissions from form example."""
     data = ctx.activity.value.action.data
-    if not data.get("action"):
-        print(ctx.activity)
-        return AdaptiveCardActionErrorResponse(
-            status_code=400,
-            type="application/vnd.microsoft.error",
-            value=HttpError(
-                code="BadRequest",
-                message="No action specified",
-                inner_http_error=InnerHttpError(
-                    status_code=400,
-                    body={"error": "No action specified"},
-                ),
-            ),
-        )
-
-    print("Received action data:", data)
-
-    if data["action"] == "submit_basic":
-        notify_value = data.get("notify", "false")
-        await ctx.send(f"Basic card submitted! Notify setting: {notify_value}")
-    elif data["action"] == "submit_feedback":
-        feedback_text = data.get("feedback", "No feedback provided")
-        await ctx.send(f"Feedback received: {feedback_text}")
-    elif data["action"] == "create_task":
-        title = data.get("title", "Untitled")
-        priority = data.get("priority", "medium")
-        due_date = data.get("due_date", "No date")
-        await ctx.send(f"Task created!\nTitle: {title}\nPriority: {priority}\nDue: {due_date}")
-    elif data["action"] == "save_profile":
-        entity_id = data.get("entity_id")
-        name = data.get("name", "Unknown")
-        email = data.get("email", "No email")
-        subscribe = data.get("subscribe", "false")
-        age = data.get("age")
-        location = data.get("location", "Not specified")
-
-        response_text = f"Profile saved!\nName: {name}\nEmail: {email}\nSubscribed: {subscribe}"
-        if entity_id:
-            response_text += f"\nEntity ID: {entity_id}"
-        if age:
-            response_text += f"\nAge: {age}"
-        if location != "Not specified":
-            response_text += f"\nLocation: {location}"
-
-        await ctx.send(response_text)
-    else:
-        return AdaptiveCardActionErrorResponse(
-            status_code=400,
-            type="application/vnd.microsoft.error",
-            value=HttpError(
-                code="BadRequest",
-                message="Unknown action",
-                inner_http_error=InnerHttpError(
-                    status_code=400,
-                    body={"error": "Unknown action"},
-                ),
-            ),
-        )
+    action = data.get("action")
+    if not action:
+        logger.debug("Card action without an action: %s", ctx.activity)
+        return NO_ACTION_RESPONSE
 
-    return AdaptiveCardActionMessageResponse(
-        status_code=200,
-        type="application/vnd.microsoft.activity.message",
-        value="Action processed successfully",
-    )
+    logger.debug("Received action data: %s", data)
+
+    handler = CARD_ACTIONS.get(action)
+    if handler is None:
+        return UNKNOWN_ACTION_RESPONSE
+
+    await handler(ctx, data)
+    return ACTION_PROCESSED_RESPONSE
+
+
+MessageHandler = Callable[[ActivityContext[MessageActivity]], Awaitable[None]]
+
+# Card requests are exact keyword messages, so one lookup picks the handler
+CARD_COMMANDS: Dict[str, MessageHandler] = {
+    "card": handle_card_message,
+    "json": handle_validate_card_message,
+    "form": handle_form,
+    "profile": handle_profile_card,
+    "validation": handle_validation_card,
+    "feedback": handle_feedback_card,
+}
 
 
 @app.on_message
 async def handle_message(ctx: ActivityContext[MessageActivity]):
-    """Handle general message activities."""
-    print(f"[GENERAL] Message received: {ctx.activity.text}")
-    print(f"[GENERAL] From: {ctx.activity.from_}")
+    """Dispatch card requests, handling any other message as general chat."""
+    handler = CARD_COMMANDS.get(ctx.activity.text)
+    if handler is not None:
+        await handler(ctx)
+        return
+
+    logger.debug("[GENERAL] Message received: %s", ctx.activity.text)
+    logger.debug("[GENERAL] From: %s", ctx.activity.from_)
 
     if "reply" in ctx.activity.text.lower():
         await ctx.reply("Hello! How can I assist you today?")
@@ -325,4 +399,4 @@ async def handle_message(ctx: ActivityContext[MessageActivity]):
 
 
 if __name__ == "__main__":
-    asyncio.run(app.start())
+    asyncio.run(app.start(), loop_factory=loop_factory)
@@ -6,9 +6,10 @@ Licensed under the MIT License.
 import asyncio
 import os
 from logging import Logger
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 from microsoft.teams.api import (
+    ActivityBase,
     AdaptiveCardAttachment,
     CardTaskModuleTaskInfo,
     InvokeResponse,
@@ -27,6 +28,11 @@ from microsoft.teams.apps.events.types import ErrorEvent
 from microsoft.teams.cards import AdaptiveCard, SubmitAction, SubmitActionData, TaskFetchSubmitActionData, TextBlock
 from microsoft.teams.common.logging import ConsoleLogger
 
+try:
+    from uvloop import new_event_loop as loop_factory
+except ImportError:  # uvloop is unavailable on Windows
+    loop_factory = None
+
 logger_instance = ConsoleLogger()
 logger: Logger = logger_instance.create_logger("@apps/dialogs")
 
@@ -37,10 +43,26 @@ app = App(client_id=os.getenv("BOT_ID"), client_secret=os.getenv("BOT_PASSWORD")
 
 app.page("customform", os.path.join(os.path.dirname(__file__), "views", "customform"), "/tabs/dialog-form")
 
+# Bound how many activities are handled at once so a burst of requests queues up instead of
+# piling work onto the event loop all at the same time
+handler_semaphore = asyncio.Semaphore(int(os.getenv("HANDLER_CONCURRENCY", "32")))
 
-@app.on_message
-async def handle_message(ctx: ActivityContext[MessageActivity]) -> None:
-    """Handle message activities and show dialog launcher card."""
+
+async def limit_concurrency(ctx: ActivityContext[ActivityBase]) -> None:
+    """Run the rest of the handler chain while holding a concurrency slot."""
+    async with handler_semaphore:
+        await ctx.next()
+
+
+app.use(limit_concurrency)
+
+
+# Every launcher action opens a dialog with the same task/fetch payload, so it is serialized once and shared
+TASK_FETCH_DATA = TaskFetchSubmitActionData().model_dump()
+
+
+def create_launcher_card() -> AdaptiveCard:
+    """Create the dialog launcher card."""
 
     # Create the launcher adaptive card using Python objects to demonstrate SubmitActionData
     # This tests that ms_teams correctly serializes to 'msteams'
@@ -50,123 +72,189 @@ async def handle_message(ctx: ActivityContext[MessageActivity]) -> None:
     # Use SubmitActionData with ms_teams to test serialization
     # SubmitActionData uses extra="allow" to accept custom fields
     simple_form_data = SubmitActionData.model_validate({"opendialogtype": "simple_form"})
-    simple_form_data.ms_teams = TaskFetchSubmitActionData().model_dump()
+    simple_form_data.ms_teams = TASK_FETCH_DATA
 
     webpage_data = SubmitActionData.model_validate({"opendialogtype": "webpage_dialog"})
-    webpage_data.ms_teams = TaskFetchSubmitActionData().model_dump()
+    webpage_data.ms_teams = TASK_FETCH_DATA
 
     multistep_data = SubmitActionData.model_validate({"opendialogtype": "multi_step_form"})
-    multistep_data.ms_teams = TaskFetchSubmitActionData().model_dump()
+    multistep_data.ms_teams = TASK_FETCH_DATA
 
     card.actions = [
         SubmitAction(title="Simple form test").with_data(simple_form_data),
         SubmitAction(title="Webpage Dialog").with_data(webpage_data),
         SubmitAction(title="Multi-step Form").with_data(multistep_data),
         # Keep this one as JSON to show mixed usage
-        SubmitAction.model_validate(
-            {
-                "type": "Action.Submit",
-                "title": "Mixed Example (JSON)",
-                "data": {"msteams": {"type": "task/fetch"}, "opendialogtype": "mixed_example"},
-            }
-        ),
+        MIXED_EXAMPLE_ACTION,
     ]
+    return card
+
+
+MIXED_EXAMPLE_ACTION = SubmitAction.model_validate(
+    {
+        "type": "Action.Submit",
+        "title": "Mixed Example (JSON)",
+        "data": {"msteams": {"type": "task/fetch"}, "opendialogtype": "mixed_example"},
+    }
+)
+
+# The launcher card does not depend on the incoming activity, so it is built once at import
+LAUNCHER_CARD = create_launcher_card()
+
+
+@app.on_message
+async def handle_message(ctx: ActivityContext[MessageActivity]) -> None:
+    """Handle message activities and show dialog launcher card."""
 
-    # Send the card as an attachment
-    message = MessageActivityInput(text="Enter this form").add_card(card)
+    # Send the card as an attachment. The activity is created per send since sending fills in
+    # conversation details on it; the card itself is shared.
+    message = MessageActivityInput(text="Enter this form").add_card(LAUNCHER_CARD)
     await ctx.send(message)
 
 
-@app.on_dialog_open
-async def handle_dialog_open(ctx: ActivityContext[TaskFetchInvokeActivity]):
-    """Handle dialog open events for all dialog types."""
-    data: Optional[Any] = ctx.activity.value.data
-    dialog_type = data.get("opendialogtype") if data else None
+# Dialog cards are parsed once from JSON at import and reused for every dialog open
+SIMPLE_FORM_CARD = AdaptiveCard.model_validate_json(
+    b"""
+{
+    "type": "AdaptiveCard",
+    "version": "1.4",
+    "body": [
+        {
+            "type": "TextBlock",
+            "text": "This is a simple form",
+            "size": "Large",
+            "weight": "Bolder"
+        },
+        {
+            "type": "Input.Text",
+            "id": "name",
+            "label": "Name",
+            "placeholder": "Enter your name",
+            "isRequired": true
+        }
+    ],
+    "actions": [
+        {
+            "type": "Action.Submit",
+            "title": "Submit",
+            "data": {
+                "submissiondialogtype": "simple_form"
+            }
+        }
+    ]
+}
+"""
+)
 
-    if dialog_type == "simple_form":
-        dialog_card = AdaptiveCard.model_validate(
-            {
-                "type": "AdaptiveCard",
-                "version": "1.4",
-                "body": [
-                    {"type": "TextBlock", "text": "This is a simple form", "size": "Large", "weight": "Bolder"},
-                    {
-                        "type": "Input.Text",
-                        "id": "name",
-                        "label": "Name",
-                        "placeholder": "Enter your name",
-                        "isRequired": True,
-                    },
-                ],
-                "actions": [
-                    {"type": "Action.Submit", "title": "Submit", "data": {"submissiondialogtype": "simple_form"}}
-                ],
+MULTI_STEP_FORM_CARD = AdaptiveCard.model_validate_json(
+    b"""
+{
+    "type": "AdaptiveCard",
+    "version": "1.4",
+    "body": [
+        {
+            "type": "TextBlock",
+            "text": "This is a multi-step form",
+            "size": "Large",
+            "weight": "Bolder"
+        },
+        {
+            "type": "Input.Text",
+            "id": "name",
+            "label": "Name",
+            "placeholder": "Enter your name",
+            "isRequired": true
+        }
+    ],
+    "actions": [
+        {
+            "type": "Action.Submit",
+            "title": "Submit",
+            "data": {
+                "submissiondialogtype": "webpage_dialog_step_1"
             }
-        )
+        }
+    ]
+}
+"""
+)
 
-        return InvokeResponse(
-            body=TaskModuleResponse(
-                task=TaskModuleContinueResponse(
-                    value=CardTaskModuleTaskInfo(
-                        title="Simple Form Dialog",
-                        card=card_attachment(AdaptiveCardAttachment(content=dialog_card)),
-                    )
+
+EMAIL_STEP_CARD = AdaptiveCard.model_validate_json(
+    b"""
+{
+    "type": "AdaptiveCard",
+    "version": "1.4",
+    "body": [
+        {
+            "type": "TextBlock",
+            "text": "Email",
+            "size": "Large",
+            "weight": "Bolder"
+        },
+        {
+            "type": "Input.Text",
+            "id": "email",
+            "label": "Email",
+            "placeholder": "Enter your email",
+            "isRequired": true
+        }
+    ]
+}
+"""
+)
+
+
+# Opening a dialog does not depend on the request beyond its type, so the responses are built once
+DIALOG_OPEN_RESPONSES: Dict[str, InvokeResponse[TaskModuleResponse]] = {
+    "simple_form": InvokeResponse(
+        body=TaskModuleResponse(
+            task=TaskModuleContinueResponse(
+                value=CardTaskModuleTaskInfo(
+                    title="Simple Form Dialog",
+                    card=card_attachment(AdaptiveCardAttachment(content=SIMPLE_FORM_CARD)),
                 )
             )
         )
-
-    elif dialog_type == "webpage_dialog":
-        return InvokeResponse(
-            body=TaskModuleResponse(
-                task=TaskModuleContinueResponse(
-                    value=UrlTaskModuleTaskInfo(
-                        title="Webpage Dialog",
-                        url=f"{os.getenv('BOT_ENDPOINT', 'http://localhost:3978')}/tabs/dialog-form",
-                        width=1000,
-                        height=800,
-                    )
+    ),
+    "webpage_dialog": InvokeResponse(
+        body=TaskModuleResponse(
+            task=TaskModuleContinueResponse(
+                value=UrlTaskModuleTaskInfo(
+                    title="Webpage Dialog",
+                    url=f"{os.getenv('BOT_ENDPOINT', 'http://localhost:3978')}/tabs/dialog-form",
+                    width=1000,
+                    height=800,
                 )
             )
         )
-
-    elif dialog_type == "multi_step_form":
-        dialog_card = AdaptiveCard.model_validate(
-            {
-                "type": "AdaptiveCard",
-                "version": "1.4",
-                "body": [
-                    {"type": "TextBlock", "text": "This is a multi-step form", "size": "Large", "weight": "Bolder"},
-                    {
-                        "type": "Input.Text",
-                        "id": "name",
-                        "label": "Name",
-                        "placeholder": "Enter your name",
-                        "isRequired": True,
-                    },
-                ],
-                "actions": [
-                    {
-                        "type": "Action.Submit",
-                        "title": "Submit",
-                        "data": {"submissiondialogtype": "webpage_dialog_step_1"},
-                    }
-                ],
-            }
-        )
-
-        return InvokeResponse(
-            body=TaskModuleResponse(
-                task=TaskModuleContinueResponse(
-                    value=CardTaskModuleTaskInfo(
-                        title="Multi-step Form Dialog",
-                        card=card_attachment(AdaptiveCardAttachment(content=dialog_card)),
-                    )
+    ),
+    "multi_step_form": InvokeResponse(
+        body=TaskModuleResponse(
+            task=TaskModuleContinueResponse(
+                value=CardTaskModuleTaskInfo(
+                    title="Multi-step Form Dialog",
+                    card=card_attachment(AdaptiveCardAttachment(content=MULTI_STEP_FORM_CARD)),
                 )
             )
         )
+    ),
+}
+
+UNKNOWN_DIALOG_RESPONSE = TaskModuleResponse(task=TaskModuleMessageResponse(value="Unknown dialog type"))
+
+
+@app.on_dialog_open
+async def handle_dialog_open(ctx: ActivityContext[TaskFetchInvokeActivity]):
+    """Handle dialog open events for all dialog types."""
+    data: Optional[Any] = ctx.activity.value.data
+    dialog_type = data.get("opendialogtype") if data else None
+
+    if dialog_type in DIALOG_OPEN_RESPONSES:
+        return DIALOG_OPEN_RESPONSES[dialog_type]
 
     # Default return for unknown dialog types
-    return TaskModuleResponse(task=TaskModuleMessageResponse(value="Unknown dialog type"))
+    return UNKNOWN_DIALOG_RESPONSE
 
 
 @app.on_dialog_submit
@@ -190,28 +278,12 @@ async def handle_dialog_submit(ctx: ActivityContext[TaskSubmitInvokeActivity]):
 
     elif dialog_type == "webpage_dialog_step_1":
         name = data.get("name") if data else None
-        next_step_card = AdaptiveCard.model_validate(
-            {
-                "type": "AdaptiveCard",
-                "version": "1.4",
-                "body": [
-                    {"type": "TextBlock", "text": "Email", "size": "Large", "weight": "Bolder"},
-                    {
-                        "type": "Input.Text",
-                        "id": "email",
-                        "label": "Email",
-                        "placeholder": "Enter your email",
-                        "isRequired": True,
-                    },
-                ],
-                "actions": [
-                    {
-                        "type": "Action.Submit",
-                        "title": "Submit",
-                        "data": {"submissiondialogtype": "webpage_dialog_step_2", "name": name},
-                    }
-                ],
-            }
+        # Only the submit action carries the name, so copy the parsed template and attach a new action
+        next_step_data = SubmitActionData.model_validate(
+            {"submissiondialogtype": "webpage_dialog_step_2", "name": name}
+        )
+        next_step_card = EMAIL_STEP_CARD.model_copy(
+            update={"actions": [SubmitAction(title="Submit").with_data(next_step_data)]}
         )
 
         return InvokeResponse(
@@ -246,4 +318,4 @@ async def handle_error(event: ErrorEvent) -> None:
 
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 3978))
-    asyncio.run(app.start(port))
+    asyncio.run(app.start(port), loop_factory=loop_factory)
@@ -5,12 +5,21 @@ Licensed under the MIT License.
 
 import asyncio
 import re
+from logging import Logger
 
 from microsoft.teams.api import MessageActivity
 from microsoft.teams.api.activities.typing import TypingActivityInput
 from microsoft.teams.apps import ActivityContext, App
+from microsoft.teams.common.logging import ConsoleLogger
 from microsoft.teams.devtools import DevToolsPlugin
 
+try:
+    from uvloop import new_event_loop as loop_factory
+except ImportError:  # uvloop is unavailable on Windows
+    loop_factory = None
+
+logger: Logger = ConsoleLogger().create_logger("@apps/echo")
+
 app = App(plugins=[DevToolsPlugin()])
 
 
@@ -23,8 +32,8 @@ async def handle_greeting(ctx: ActivityContext[MessageActivity]) -> None:
 @app.on_message
 async def handle_message(ctx: ActivityContext[MessageActivity]):
     """Handle message activities using the new generated handler system."""
-    print(f"[GENERATED onMessage] Message received: {ctx.activity.text}")
-    print(f"[GENERATED onMessage] From: {ctx.activity.from_}")
+    logger.debug("[GENERATED onMessage] Message received: %s", ctx.activity.text)
+    logger.debug("[GENERATED onMessage] From: %s", ctx.activity.from_)
     await ctx.reply(TypingActivityInput())
 
     if "reply" in ctx.activity.text.lower():
@@ -34,4 +43,4 @@ async def handle_message(ctx: ActivityContext[MessageActivity]):
 
 
 if __name__ == "__main__":
-    asyncio.run(app.start())
+    asyncio.run(app.start(), loop_factory=loop_factory)
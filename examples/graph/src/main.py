@@ -6,20 +6,32 @@ Licensed under the MIT License.
 import asyncio
 import logging
 import os
+from typing import Dict, Optional, Tuple
 
+import httpx
 from azure.core.exceptions import ClientAuthenticationError
 from microsoft.teams.api import MessageActivity
-from microsoft.teams.apps import ActivityContext, App, AppOptions, ErrorEvent, SignInEvent
-from microsoft.teams.graph import get_graph_client
+from microsoft.teams.apps import ActivityContext, App, AppOptions, ErrorEvent, SignInEvent, StopEvent
+from microsoft.teams.graph import create_graph_http_client, get_graph_client
+from msgraph.generated.models.message_collection_response import MessageCollectionResponse  # type: ignore
+from msgraph.generated.models.user import User  # type: ignore
 from msgraph.generated.users.item.messages.messages_request_builder import (  # type: ignore
     MessagesRequestBuilder,
 )
+from msgraph.graph_service_client import GraphServiceClient
 
 logger = logging.getLogger(__name__)
 
 app_options = AppOptions(default_connection_name=os.getenv("CONNECTION_NAME", "graph"))
 app = App(**app_options)
 
+# One HTTP/2 connection pool shared by every user's Graph client, with idle connections kept
+# warm for a minute so follow-up commands skip the TLS handshake.
+graph_http_client = create_graph_http_client(httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60))
+
+# Graph clients by user ID along with the token they were built for, reused until the user's token changes.
+graph_clients: Dict[str, Tuple[str, GraphServiceClient]] = {}
+
 
 async def get_authenticated_graph_client(ctx: ActivityContext[MessageActivity]):
     """
@@ -34,9 +46,17 @@ async def get_authenticated_graph_client(ctx: ActivityContext[MessageActivity]):
         await ctx.sign_in()
         return None
 
+    user_id = ctx.activity.from_.id
+    cached = graph_clients.get(user_id)
+    if cached and cached[0] == ctx.user_token:
+        return cached[1]
+
     try:
         # Create Graph client using the user token
-        return get_graph_client(ctx.user_token)
+        graph = get_graph_client(ctx.user_token, http_client=graph_http_client)
+        if ctx.user_token:
+            graph_clients[user_id] = (ctx.user_token, graph)
+        return graph
 
     except Exception as e:
         ctx.logger.error(f"Failed to create Graph client: {e}")
@@ -62,9 +82,53 @@ async def handle_signout_command(ctx: ActivityContext[MessageActivity]):
         await ctx.send("ℹ️ You are not currently signed in.")
     else:
         await ctx.sign_out()
+        graph_clients.pop(ctx.activity.from_.id, None)
         await ctx.send("👋 You have been signed out successfully!")
 
 
+# The recent emails query never changes, so its request configuration is built once
+RECENT_EMAILS_REQUEST = MessagesRequestBuilder.MessagesRequestBuilderGetRequestConfiguration(
+    query_parameters=MessagesRequestBuilder.MessagesRequestBuilderGetQueryParameters(
+        select=["subject", "from", "receivedDateTime"], top=5
+    )
+)
+
+
+async def get_recent_emails(graph: GraphServiceClient) -> Optional[MessageCollectionResponse]:
+    """Fetch the user's 5 most recent emails."""
+    return await graph.me.messages.get(request_configuration=RECENT_EMAILS_REQUEST)
+
+
+def format_profile(me: Optional[User]) -> str:
+    """Format the user's profile for display."""
+    if not me:
+        return "❌ Could not retrieve your profile information."
+
+    return (
+        f"👤 **Your Profile**\n\n"
+        f"**Name:** {me.display_name or 'N/A'}\n\n"
+        f"**Email:** {me.user_principal_name or 'N/A'}\n\n"
+        f"**Job Title:** {me.job_title or 'N/A'}\n\n"
+        f"**Department:** {me.department or 'N/A'}\n\n"
+        f"**Office:** {me.office_location or 'N/A'}"
+    )
+
+
+def format_emails(messages: Optional[MessageCollectionResponse]) -> str:
+    """Format the user's recent emails for display."""
+    if not messages or not messages.value:
+        return "📪 No recent emails found."
+
+    parts = ["📧 **Your Recent Emails**\n\n"]
+    for i, message in enumerate(messages.value[:5], 1):
+        subject = message.subject or "No Subject"
+        sender = address.name if message.from_ and (address := message.from_.email_address) else "Unknown"
+        received = message.received_date_time.strftime("%Y-%m-%d %H:%M") if message.received_date_time else "Unknown"
+        parts.append(f"**{i}.** {subject}\n   **From:** {sender}\n   **Received:** {received}\n\n")
+
+    return "".join(parts)
+
+
 @app.on_message_pattern("profile")
 async def handle_profile_command(ctx: ActivityContext[MessageActivity]):
     """Handle profile command using Graph API with TokenProtocol pattern."""
@@ -75,21 +139,10 @@ async def handle_profile_command(ctx: ActivityContext[MessageActivity]):
 
         # Fetch user profile
         me = await graph.me.get()
-
-        if me:
-            profile_info = (
-                f"👤 **Your Profile**\n\n"
-                f"**Name:** {me.display_name or 'N/A'}\n\n"
-                f"**Email:** {me.user_principal_name or 'N/A'}\n\n"
-                f"**Job Title:** {me.job_title or 'N/A'}\n\n"
-                f"**Department:** {me.department or 'N/A'}\n\n"
-                f"**Office:** {me.office_location or 'N/A'}"
-            )
-            await ctx.send(profile_info)
-        else:
-            await ctx.send("❌ Could not retrieve your profile information.")
+        await ctx.send(format_profile(me))
 
     except ClientAuthenticationError as e:
+        graph_clients.pop(ctx.activity.from_.id, None)
         ctx.logger.error(f"Authentication error: {e}")
         await ctx.send("🔐 Authentication failed. Please try signing in again.")
         await ctx.sign_in()
@@ -107,84 +160,87 @@ async def handle_emails_command(ctx: ActivityContext[MessageActivity]):
         if not graph:
             return
 
-        # Fetch recent messages (top 5) using proper RequestConfiguration pattern
-        query_params = MessagesRequestBuilder.MessagesRequestBuilderGetQueryParameters(
-            select=["subject", "from", "receivedDateTime"], top=5
-        )
-        request_config = MessagesRequestBuilder.MessagesRequestBuilderGetRequestConfiguration(
-            query_parameters=query_params
-        )
+        messages = await get_recent_emails(graph)
+        await ctx.send(format_emails(messages))
 
-        messages = await graph.me.messages.get(request_configuration=request_config)
+    except ClientAuthenticationError as e:
+        graph_clients.pop(ctx.activity.from_.id, None)
+        ctx.logger.error(f"Authentication error: {e}")
+        await ctx.send("🔐 Authentication failed. You may need additional permissions to read emails.")
 
-        if messages and messages.value:
-            email_list = "📧 **Your Recent Emails**\n\n"
+    except Exception as e:
+        ctx.logger.error(f"Error getting emails: {e}")
+        await ctx.send(f"❌ Failed to get your emails: {str(e)}")
 
-            for i, message in enumerate(messages.value[:5], 1):
-                subject = message.subject or "No Subject"
-                sender = (
-                    message.from_.email_address.name if message.from_ and message.from_.email_address else "Unknown"
-                )
-                received = (
-                    message.received_date_time.strftime("%Y-%m-%d %H:%M") if message.received_date_time else "Unknown"
-                )
 
-                email_list += f"**{i}.** {subject}\n"
-                email_list += f"   **From:** {sender}\n"
-                email_list += f"   **Received:** {received}\n\n"
+@app.on_message_pattern("me")
+async def handle_me_command(ctx: ActivityContext[MessageActivity]):
+    """Handle me command, showing the profile and recent emails together."""
+    try:
+        graph = await get_authenticated_graph_client(ctx)
+        if not graph:
+            return
 
-            await ctx.send(email_list)
-        else:
-            await ctx.send("📪 No recent emails found.")
+        # The profile and emails requests are independent, so they are made concurrently
+        me, messages = await asyncio.gather(graph.me.get(), get_recent_emails(graph))
+        await ctx.send(f"{format_profile(me)}\n\n{format_emails(messages)}")
 
     except ClientAuthenticationError as e:
+        graph_clients.pop(ctx.activity.from_.id, None)
         ctx.logger.error(f"Authentication error: {e}")
-        await ctx.send("🔐 Authentication failed. You may need additional permissions to read emails.")
+        await ctx.send("🔐 Authentication failed. Please try signing in again.")
+        await ctx.sign_in()
 
     except Exception as e:
-        ctx.logger.error(f"Error getting emails: {e}")
-        await ctx.send(f"❌ Failed to get your emails: {str(e)}")
+        ctx.logger.error(f"Error getting profile and emails: {e}")
+        await ctx.send(f"❌ Failed to get your profile and emails: {str(e)}")
+
+
+HELP_TEXT = (
+    "🤖 **Teams Graph Demo Bot - TokenProtocol Edition**\n\n"
+    "This bot demonstrates Microsoft Graph integration using the TokenProtocol "
+    "pattern with exact token expiration handling.\n\n"
+    "**Available Commands:**\n\n"
+    "• **signin** - Sign in to your Microsoft account\n\n"
+    "• **signout** - Sign out of your account\n\n"
+    "• **profile** - View your Microsoft profile information\n\n"
+    "• **emails** - List your 5 most recent emails\n\n"
+    "• **me** - View your profile and recent emails together\n\n"
+    "• **help** - Show this help message\n\n"
+    "**Getting Started:**\n\n"
+    "1. Type `signin` to authenticate\n\n"
+    "2. Once signed in, try `profile` or `emails`\n\n"
+    "3. Type `signout` when you're done\n\n"
+    "**Technical Implementation:**\n\n"
+    "• Uses TokenProtocol with callable-based approach for exact expiration times\n\n"
+    "• Eliminates token expiration guesswork and provides better error handling\n\n"
+    "• Direct integration with Microsoft Graph using structured token metadata\n\n"
+    "**Note:** This bot requires appropriate permissions to access your Microsoft Graph data."
+)
+
+DEFAULT_TEXT = (
+    "👋 **Hello! I'm a Teams Graph demo bot.**\n\n"
+    "**Available commands:**\n\n"
+    "• **signin** - Sign in to your Microsoft account\n\n"
+    "• **signout** - Sign out\n\n"
+    "• **profile** - Show your profile information\n\n"
+    "• **emails** - List your recent emails\n\n"
+    "• **me** - Show your profile and recent emails together\n\n"
+    "• **help** - Show detailed help with technical info"
+)
 
 
 @app.on_message_pattern("help")
 async def handle_help_command(ctx: ActivityContext[MessageActivity]):
     """Handle help command."""
-    help_text = (
-        "🤖 **Teams Graph Demo Bot - TokenProtocol Edition**\n\n"
-        "This bot demonstrates Microsoft Graph integration using the TokenProtocol "
-        "pattern with exact token expiration handling.\n\n"
-        "**Available Commands:**\n\n"
-        "• **signin** - Sign in to your Microsoft account\n\n"
-        "• **signout** - Sign out of your account\n\n"
-        "• **profile** - View your Microsoft profile information\n\n"
-        "• **emails** - List your 5 most recent emails\n\n"
-        "• **help** - Show this help message\n\n"
-        "**Getting Started:**\n\n"
-        "1. Type `signin` to authenticate\n\n"
-        "2. Once signed in, try `profile` or `emails`\n\n"
-        "3. Type `signout` when you're done\n\n"
-        "**Technical Implementation:**\n\n"
-        "• Uses TokenProtocol with callable-based approach for exact expiration times\n\n"
-        "• Eliminates token expiration guesswork and provides better error handling\n\n"
-        "• Direct integration with Microsoft Graph using structured token metadata\n\n"
-        "**Note:** This bot requires appropriate permissions to access your Microsoft Graph data."
-    )
-    await ctx.send(help_text)
+    await ctx.send(HELP_TEXT)
 
 
 @app.on_message
 async def handle_default_message(ctx: ActivityContext[MessageActivity]):
     """Handle default message when no pattern matches."""
     # Default response with help
-    await ctx.send(
-        "👋 **Hello! I'm a Teams Graph demo bot.**\n\n"
-        "**Available commands:**\n\n"
-        "• **signin** - Sign in to your Microsoft account\n\n"
-        "• **signout** - Sign out\n\n"
-        "• **profile** - Show your profile information\n\n"
-        "• **emails** - List your recent emails\n\n"
-        "• **help** - Show detailed help with technical info"
-    )
+    await ctx.send(DEFAULT_TEXT)
 
 
 @app.event("sign_in")
@@ -195,10 +251,17 @@ async def handle_sign_in_event(event: SignInEvent):
         "You can now use these commands:\n\n"
         "• **profile** - View your profile\n\n"
         "• **emails** - View your recent emails\n\n"
+        "• **me** - View your profile and recent emails together\n\n"
         "• **signout** - Sign out when done"
     )
 
 
+@app.event("stop")
+async def handle_stop(event: StopEvent):
+    """Release the shared Graph connections when the app stops."""
+    await graph_http_client.aclose()
+
+
 @app.event("error")
 async def handle_error_event(event: ErrorEvent):
     """Handle error events."""
@@ -5,18 +5,22 @@ Licensed under the MIT License.
 
 import asyncio
 import re
+from logging import Logger
 from os import getenv
 
 from dotenv import find_dotenv, load_dotenv
 from microsoft.teams.ai import ChatPrompt, ListMemory
 from microsoft.teams.api import MessageActivity, MessageActivityInput, TypingActivityInput
 from microsoft.teams.apps import ActivityContext, App
+from microsoft.teams.common.logging import ConsoleLogger
 from microsoft.teams.devtools import DevToolsPlugin
 from microsoft.teams.mcpplugin import McpClientPlugin, McpClientPluginParams
 from microsoft.teams.openai import OpenAICompletionsAIModel, OpenAIResponsesAIModel
 
 load_dotenv(find_dotenv(usecwd=True))
 
+logger: Logger = ConsoleLogger().create_logger("@apps/mcp-client")
+
 app = App(plugins=[DevToolsPlugin()])
 
 
@@ -55,10 +59,12 @@ if GITHUB_PAT:
     mcp_plugin.use_mcp_server(
         "https://api.githubcopilot.com/mcp/", McpClientPluginParams(headers={"Authorization": f"Bearer {GITHUB_PAT}"})
     )
-    print("✅ GitHub MCP server configured with authentication")
+    logger.info("GitHub MCP server configured with authentication")
 else:
-    print("⚠️  GITHUB_PAT not found - GitHub MCP server not configured")
-    print("   Set GITHUB_PAT environment variable to enable GitHub MCP integration")
+    logger.warning(
+        "GITHUB_PAT not found - GitHub MCP server not configured. "
+        "Set GITHUB_PAT environment variable to enable GitHub MCP integration"
+    )
 # Example of additional servers (commented out - would need actual working endpoints):
 # mcp_plugin.use_mcp_server("https://example.com/mcp/weather")
 # mcp_plugin.use_mcp_server("https://example.com/mcp/pokemon")
@@ -74,49 +80,78 @@ chat_prompt = ChatPrompt(completions_model, plugins=[mcp_plugin])
 
 
 # Pattern-based handlers to demonstrate different MCP usage patterns
+# Patterns are compiled once and reused by the handlers to pull out the query
+AGENT_PATTERN = re.compile(r"^agent\s+(.+)", re.IGNORECASE)
+PROMPT_PATTERN = re.compile(r"^prompt\s+(.+)", re.IGNORECASE)
+MCP_INFO_PATTERN = re.compile(r"^mcp\s+info", re.IGNORECASE)
+
+
+async def send_prompt_response(
+    ctx: ActivityContext[MessageActivity], prompt: ChatPrompt, query: str, instructions: str | None = None
+) -> None:
+    """Send a prompt's response, streaming it as it is generated in 1:1 chats"""
+    if ctx.activity.conversation.is_group:
+        # Streaming is not supported in group chats, so send the full response once it completes
+        await ctx.send(TypingActivityInput())
+        result = await prompt.send(query, instructions=instructions)
+        if result.response.content:
+            await ctx.send(MessageActivityInput(text=result.response.content).add_ai_generated())
+        return
+
+    # The stream batches emitted chunks into periodic updates of a single message
+    streamed = False
+
+    def on_chunk(chunk: str) -> None:
+        nonlocal streamed
+        streamed = True
+        ctx.stream.emit(chunk)
+
+    result = await prompt.send(query, instructions=instructions, on_chunk=on_chunk)
 
+    # Stateful Responses models don't stream, so their answer is emitted once it completes
+    if not streamed and result.response.content:
+        ctx.stream.emit(result.response.content)
+    ctx.stream.emit(MessageActivityInput().add_ai_generated())
 
-@app.on_message_pattern(re.compile(r"^agent\s+(.+)", re.IGNORECASE))
+
+@app.on_message_pattern(AGENT_PATTERN)
 async def handle_agent_chat(ctx: ActivityContext[MessageActivity]):
     """Handle 'agent <query>' command using ChatPrompt with MCP tools (stateful)"""
-    match = re.match(r"^agent\s+(.+)", ctx.activity.text, re.IGNORECASE)
+    match = AGENT_PATTERN.match(ctx.activity.text)
     if match:
         query = match.group(1).strip()
+        if not query:
+            return
 
-        print(f"[AGENT] Processing: {query}")
-        await ctx.send(TypingActivityInput())
+        logger.debug("[AGENT] Processing: %s", query)
 
         # Use ChatPrompt with MCP tools (stateful conversation)
-        result = await responses_prompt.send(query)
-        if result.response.content:
-            message = MessageActivityInput(text=result.response.content).add_ai_generated()
-            await ctx.send(message)
+        await send_prompt_response(ctx, responses_prompt, query)
 
 
-@app.on_message_pattern(re.compile(r"^prompt\s+(.+)", re.IGNORECASE))
+@app.on_message_pattern(PROMPT_PATTERN)
 async def handle_prompt_chat(ctx: ActivityContext[MessageActivity]):
     """Handle 'prompt <query>' command using ChatPrompt with MCP tools (stateless)"""
-    match = re.match(r"^prompt\s+(.+)", ctx.activity.text, re.IGNORECASE)
+    match = PROMPT_PATTERN.match(ctx.activity.text)
     if match:
         query = match.group(1).strip()
+        if not query:
+            return
 
-        print(f"[PROMPT] Processing: {query}")
-        await ctx.send(TypingActivityInput())
+        logger.debug("[PROMPT] Processing: %s", query)
 
         # Use ChatPrompt with MCP tools (demonstrates docs pattern)
-        result = await chat_prompt.send(
-            input=query,
+        await send_prompt_response(
+            ctx,
+            chat_prompt,
+            query,
             instructions=(
                 "You are a helpful assistant with access to remote MCP tools.Use them to help answer questions."
             ),
         )
 
-        if result.response.content:
-            message = MessageActivityInput(text=result.response.content).add_ai_generated()
-            await ctx.send(message)
-
 
-@app.on_message_pattern(re.compile(r"^mcp\s+info", re.IGNORECASE))
+@app.on_message_pattern(MCP_INFO_PATTERN)
 async def handle_mcp_info(ctx: ActivityContext[MessageActivity]):
     """Handle 'mcp info' command to show available MCP servers and tools"""
     # Build server list dynamically based on what's configured
@@ -151,15 +186,15 @@ async def handle_mcp_info(ctx: ActivityContext[MessageActivity]):
 @app.on_message
 async def handle_fallback_message(ctx: ActivityContext[MessageActivity]):
     """Fallback handler using ChatPrompt with MCP tools"""
-    print(f"[FALLBACK] Message received: {ctx.activity.text}")
-    print(f"[FALLBACK] From: {ctx.activity.from_}")
-    await ctx.send(TypingActivityInput())
+    # Attachment-only and card submit activities carry no text to prompt with
+    text = (ctx.activity.text or "").strip()
+    if not text:
+        return
+
+    logger.debug("[FALLBACK] Message received from %s: %s", ctx.activity.from_.id, text)
 
     # Use ChatPrompt with MCP tools for general conversation
-    result = await responses_prompt.send(ctx.activity.text)
-    if result.response.content:
-        message = MessageActivityInput(text=result.response.content).add_ai_generated()
-        await ctx.send(message)
+    await send_prompt_response(ctx, responses_prompt, text)
 
 
 if __name__ == "__main__":
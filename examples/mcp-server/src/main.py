@@ -4,23 +4,30 @@ Licensed under the MIT License.
 """
 
 import asyncio
-from typing import Dict
+import operator
+from logging import Logger
+from typing import Callable, Dict
 
 from microsoft.teams.ai import Function
 from microsoft.teams.api.activities.message.message import MessageActivity
 from microsoft.teams.apps import App
 from microsoft.teams.apps.routing.activity_context import ActivityContext
+from microsoft.teams.common import ConsoleLogger, LocalStorage, LocalStorageOptions
 from microsoft.teams.devtools import DevToolsPlugin
 from microsoft.teams.mcpplugin import McpServerPlugin
 from pydantic import BaseModel
 
+logger: Logger = ConsoleLogger().create_logger("@apps/mcp-server")
+
 # Configure MCP server with custom name (as shown in docs)
 mcp_server_plugin = McpServerPlugin(
     name="test-mcp",
 )
 
-# Storage for conversation IDs (for proactive messaging)
-conversation_storage: Dict[str, str] = {}
+# Storage for conversation IDs (for proactive messaging). It is capped so the least recently
+# active users are evicted instead of growing without bound; swap in a persistent Storage
+# implementation to keep conversation IDs across restarts.
+conversation_storage = LocalStorage[str](options=LocalStorageOptions(max=10_000))
 
 
 # Echo tool from documentation example
@@ -47,18 +54,21 @@ class CalculateParams(BaseModel):
     b: float
 
 
+OPERATIONS: Dict[str, Callable[[float, float], float]] = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv,
+}
+
+
 async def calculate_handler(params: CalculateParams) -> str:
-    match params.operation:
-        case "add":
-            return str(params.a + params.b)
-        case "subtract":
-            return str(params.a - params.b)
-        case "multiply":
-            return str(params.a * params.b)
-        case "divide":
-            return str(params.a / params.b) if params.b != 0 else "Cannot divide by zero"
-        case _:
-            return "Unknown operation"
+    operation = OPERATIONS.get(params.operation)
+    if operation is None:
+        return "Unknown operation"
+    if operation is operator.truediv and params.b == 0:
+        return "Cannot divide by zero"
+    return str(operation(params.a, params.b))
 
 
 # Alert tool for proactive messaging (as mentioned in docs)
@@ -86,44 +96,37 @@ async def alert_handler(params: AlertParams) -> str:
     return f"Alert sent to user {params.user_id}: {params.message} (conversation: {conversation_id})"
 
 
-# Register echo tool (from documentation)
-mcp_server_plugin.use_tool(
-    Function(
-        name="echo",
-        description="echo back whatever you said",
-        parameter_schema=EchoParams,
-        handler=echo_handler,
-    )
-)
-
-# Register weather tool
-mcp_server_plugin.use_tool(
-    Function(
-        name="get_weather",
-        description="Get a location's weather",
-        parameter_schema=GetWeatherParams,
-        handler=get_weather_handler,
-    )
-)
-
-# Register calculator tool
-mcp_server_plugin.use_tool(
-    Function(
-        name="calculate",
-        description="Perform basic arithmetic operations",
-        parameter_schema=CalculateParams,
-        handler=calculate_handler,
-    )
-)
-
-# Register alert tool for proactive messaging
-mcp_server_plugin.use_tool(
-    Function(
-        name="alert",
-        description="Send proactive message to a Teams user",
-        parameter_schema=AlertParams,
-        handler=alert_handler,
-    )
+mcp_server_plugin.use_tools(
+    [
+        # Echo tool (from documentation)
+        Function(
+            name="echo",
+            description="echo back whatever you said",
+            parameter_schema=EchoParams,
+            handler=echo_handler,
+        ),
+        # Weather tool
+        Function(
+            name="get_weather",
+            description="Get a location's weather",
+            parameter_schema=GetWeatherParams,
+            handler=get_weather_handler,
+        ),
+        # Calculator tool
+        Function(
+            name="calculate",
+            description="Perform basic arithmetic operations",
+            parameter_schema=CalculateParams,
+            handler=calculate_handler,
+        ),
+        # Alert tool for proactive messaging
+        Function(
+            name="alert",
+            description="Send proactive message to a Teams user",
+            parameter_schema=AlertParams,
+            handler=alert_handler,
+        ),
+    ]
 )
 
 app = App(plugins=[mcp_server_plugin, DevToolsPlugin()])
@@ -138,9 +141,9 @@ async def handle_message(ctx: ActivityContext[MessageActivity]):
     # Store conversation ID for this user (for proactive messaging)
     user_id = ctx.activity.from_.id
     conversation_id = ctx.activity.conversation.id
-    conversation_storage[user_id] = conversation_id
+    conversation_storage.set(user_id, conversation_id)
 
-    print(f"User {ctx.activity.from_} just sent a message!")
+    logger.debug("User %s just sent a message!", user_id)
 
     # Echo back the message with info about stored conversation
     await ctx.reply(
@@ -5,12 +5,62 @@ Licensed under the MIT License.
 
 from typing import Any, Dict, List, Union
 
-from microsoft.teams.api import Account, Message
+from microsoft.teams.api import Account, CardImage, Message, ThumbnailCard
 from microsoft.teams.cards import AdaptiveCard
 
 IMAGE_URL = "https://github.com/microsoft/teams-agent-accelerator-samples/raw/main/python/memory-sample-agent/docs/images/memory-thumbnail.png"
 
 
+# Card layouts are validated once at import. Per-request cards are shallow copies of these
+# templates with the text of their text blocks swapped in, skipping revalidation.
+SEARCH_RESULT_CARD_TEMPLATE = AdaptiveCard.model_validate(
+    {
+        "type": "AdaptiveCard",
+        "version": "1.4",
+        "body": [
+            {
+                "type": "TextBlock",
+                "text": "",
+                "size": "Large",
+                "weight": "Bolder",
+                "color": "Accent",
+                "style": "heading",
+            },
+            {"type": "TextBlock", "text": "", "wrap": True, "spacing": "Medium"},
+        ],
+    }
+)
+
+LINK_UNFURL_IMAGE = CardImage(url=IMAGE_URL)
+
+LINK_UNFURL_CARD_TEMPLATE = AdaptiveCard.model_validate(
+    {
+        "type": "AdaptiveCard",
+        "version": "1.4",
+        "body": [
+            {
+                "type": "TextBlock",
+                "text": "Unfurled Link",
+                "size": "Large",
+                "weight": "Bolder",
+                "color": "Accent",
+                "style": "heading",
+            },
+            {"type": "TextBlock", "text": "", "size": "Small", "weight": "Lighter", "color": "Good"},
+        ],
+    }
+)
+
+
+def fill_text_blocks(template: AdaptiveCard, texts: Dict[int, str]) -> AdaptiveCard:
+    """Copy a card template, setting the text of the body elements at the given indexes."""
+    body = [
+        element.model_copy(update={"text": texts[i]}) if i in texts else element
+        for i, element in enumerate(template.body or [])
+    ]
+    return template.model_copy(update={"body": body})
+
+
 def create_card(data: Dict[str, str]) -> AdaptiveCard:
     """Create an adaptive card from form data."""
     return AdaptiveCard.model_validate(
@@ -94,7 +144,7 @@ def create_message_details_card(message_payload: Message) -> AdaptiveCard:
 
 def create_conversation_members_card(members: List[Account]) -> AdaptiveCard:
     """Create a card showing conversation members."""
-    members_list = ", ".join(member.name for member in members if member.name)
+    members_list = ", ".join(filter(None, (member.name for member in members)))
 
     return AdaptiveCard.model_validate(
         {
@@ -115,79 +165,38 @@ def create_conversation_members_card(members: List[Account]) -> AdaptiveCard:
     )
 
 
-async def create_dummy_cards(search_query: str) -> List[Dict[str, Any]]:
-    """Create dummy cards for search results."""
-    dummy_items = [
-        {
-            "title": "Item 1",
-            "description": f"This is the first item and this is your search query: {search_query}",
-        },
-        {"title": "Item 2", "description": "This is the second item"},
-        {"title": "Item 3", "description": "This is the third item"},
-        {"title": "Item 4", "description": "This is the fourth item"},
-        {"title": "Item 5", "description": "This is the fifth item"},
-    ]
+SEARCH_RESULT_IMAGE = CardImage(
+    alt="Mario PNG",
+    url="https://us-prod.asyncgw.teams.microsoft.com/urlp/v1/url/content?url=https%3a%2f%2ftse1.mm.bing.net%2fth%2fid%2fOIP.0PJdFY9vGiLB0l2ApUUraQHaJP%3fpid%3dApi%26w%3d85%26h%3d85%26c%3d7",
+)
 
-    cards: List[Dict[str, Any]] = []
-    for item in dummy_items:
-        card_data: Dict[str, Any] = {
-            "card": AdaptiveCard.model_validate(
-                {
-                    "type": "AdaptiveCard",
-                    "version": "1.4",
-                    "body": [
-                        {
-                            "type": "TextBlock",
-                            "text": item["title"],
-                            "size": "Large",
-                            "weight": "Bolder",
-                            "color": "Accent",
-                            "style": "heading",
-                        },
-                        {"type": "TextBlock", "text": item["description"], "wrap": True, "spacing": "Medium"},
-                    ],
-                }
-            ),
-            "thumbnail": {
-                "title": item["title"],
-                "text": item["description"],
-                "images": [
-                    {
-                        "alt": "Mario PNG",
-                        "url": "https://us-prod.asyncgw.teams.microsoft.com/urlp/v1/url/content?url=https%3a%2f%2ftse1.mm.bing.net%2fth%2fid%2fOIP.0PJdFY9vGiLB0l2ApUUraQHaJP%3fpid%3dApi%26w%3d85%26h%3d85%26c%3d7",
-                    }
-                ],
-            },
-        }
-        cards.append(card_data)
 
-    return cards
+def create_search_result(title: str, description: str) -> Dict[str, Any]:
+    """Create a search result card with its thumbnail preview."""
+    return {
+        "card": fill_text_blocks(SEARCH_RESULT_CARD_TEMPLATE, {0: title, 1: description}),
+        "thumbnail": ThumbnailCard(title=title, text=description, images=[SEARCH_RESULT_IMAGE]),
+    }
+
+
+# Only the first result depends on the search query, so the rest are built once
+STATIC_SEARCH_RESULTS = [
+    create_search_result("Item 2", "This is the second item"),
+    create_search_result("Item 3", "This is the third item"),
+    create_search_result("Item 4", "This is the fourth item"),
+    create_search_result("Item 5", "This is the fifth item"),
+]
+
+
+def create_query_search_result(search_query: str) -> Dict[str, Any]:
+    """Create the search result that echoes the search query."""
+    return create_search_result("Item 1", f"This is the first item and this is your search query: {search_query}")
 
 
 def create_link_unfurl_card(url: str) -> Dict[str, Any]:
     """Create a card for link unfurling."""
-    thumbnail = {
-        "title": "Unfurled Link",
-        "text": url,
-        "images": [{"url": IMAGE_URL}],
-    }
+    thumbnail = ThumbnailCard(title="Unfurled Link", text=url, images=[LINK_UNFURL_IMAGE])
 
-    card = AdaptiveCard.model_validate(
-        {
-            "type": "AdaptiveCard",
-            "version": "1.4",
-            "body": [
-                {
-                    "type": "TextBlock",
-                    "text": "Unfurled Link",
-                    "size": "Large",
-                    "weight": "Bolder",
-                    "color": "Accent",
-                    "style": "heading",
-                },
-                {"type": "TextBlock", "text": url, "size": "Small", "weight": "Lighter", "color": "Good"},
-            ],
-        }
-    )
+    card = fill_text_blocks(LINK_UNFURL_CARD_TEMPLATE, {1: url})
 
     return {"card": card, "thumbnail": thumbnail}
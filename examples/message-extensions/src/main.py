@@ -6,17 +6,18 @@ Licensed under the MIT License.
 import asyncio
 import os
 from pathlib import Path
-from typing import cast
+from typing import Callable, Optional, cast
 
 from cards import (
+    STATIC_SEARCH_RESULTS,
     create_card,
     create_conversation_members_card,
-    create_dummy_cards,
     create_link_unfurl_card,
     create_message_details_card,
+    create_query_search_result,
 )
 from microsoft.teams.api import (
-    AdaptiveCardAttachment,
+    Attachment,
     ConfigFetchInvokeActivity,
     ConfigInvokeResponse,
     ConfigSubmitInvokeActivity,
@@ -31,14 +32,13 @@ from microsoft.teams.api import (
     MessageExtensionSettingInvokeActivity,
     MessageExtensionSubmitActionInvokeActivity,
     TaskModuleMessageResponse,
-    ThumbnailCardAttachment,
     UrlTaskModuleTaskInfo,
-    card_attachment,
 )
 from microsoft.teams.api.models import (
     CardAction,
     CardActionType,
     CardTaskModuleTaskInfo,
+    MessagingExtensionAction,
     MessagingExtensionActionInvokeResponse,
     MessagingExtensionAttachment,
     MessagingExtensionAttachmentLayout,
@@ -48,12 +48,52 @@ from microsoft.teams.api.models import (
     MessagingExtensionSuggestedAction,
     TaskModuleContinueResponse,
 )
-from microsoft.teams.api.models.card.thumbnail_card import ThumbnailCard
 from microsoft.teams.apps import ActivityContext, App
+from microsoft.teams.cards import AdaptiveCard
 from typing_extensions import Any, Dict
 
+try:
+    from uvloop import new_event_loop as loop_factory
+except ImportError:  # uvloop is unavailable on Windows
+    loop_factory = None
+
 app = App()
 
+# The settings page URL is fixed once the app starts, so it is resolved a single time
+SETTINGS_URL = f"{os.environ.get('BOT_ENDPOINT', '')}/tabs/settings"
+
+CONFIG_OPEN_RESPONSE = ConfigInvokeResponse(
+    config=TaskModuleContinueResponse(value=UrlTaskModuleTaskInfo(url=SETTINGS_URL))
+)
+
+
+# Attachments are built directly with their content types rather than through card_attachment,
+# which validates and then copies each card into a second model
+ADAPTIVE_CARD_CONTENT_TYPE = "application/vnd.microsoft.card.adaptive"
+THUMBNAIL_CARD_CONTENT_TYPE = "application/vnd.microsoft.card.thumbnail"
+
+
+def create_search_attachment(card_data: Dict[str, Any]) -> MessagingExtensionAttachment:
+    """Wrap a search result card and its thumbnail preview in a message extension attachment."""
+    return MessagingExtensionAttachment(
+        content_type=ADAPTIVE_CARD_CONTENT_TYPE,
+        content=card_data["card"],
+        preview=Attachment(content_type=THUMBNAIL_CARD_CONTENT_TYPE, content=card_data["thumbnail"]),
+    )
+
+
+# Responses are serialized without being modified, so the attachments for results that
+# don't depend on the search query, and the empty result, are built once and shared
+STATIC_SEARCH_ATTACHMENTS = [create_search_attachment(card_data) for card_data in STATIC_SEARCH_RESULTS]
+
+EMPTY_RESULT_RESPONSE = MessagingExtensionInvokeResponse(
+    compose_extension=MessagingExtensionResult(
+        type=MessagingExtensionResultType.RESULT,
+        attachment_layout=MessagingExtensionAttachmentLayout.LIST,
+        attachments=[],
+    )
+)
+
 
 @app.on_message
 async def handle_message(ctx: ActivityContext[MessageActivity]):
@@ -78,13 +118,7 @@ async def handle_message_ext_query_link(ctx: ActivityContext[MessageExtensionQue
     if not url:
         return InvokeResponse[MessagingExtensionInvokeResponse](status=400)
 
-    card_data = create_link_unfurl_card(url)
-    main_attachment = card_attachment(AdaptiveCardAttachment(content=card_data["card"]))
-    preview_attachment = card_attachment(ThumbnailCardAttachment(content=card_data["thumbnail"]))
-
-    attachment = MessagingExtensionAttachment(
-        content_type=main_attachment.content_type, content=main_attachment.content, preview=preview_attachment
-    )
+    attachment = create_search_attachment(create_link_unfurl_card(url))
 
     result = MessagingExtensionResult(
         type=MessagingExtensionResultType.RESULT,
@@ -95,21 +129,33 @@ async def handle_message_ext_query_link(ctx: ActivityContext[MessageExtensionQue
     return MessagingExtensionInvokeResponse(compose_extension=result)
 
 
+def build_created_card(action: MessagingExtensionAction) -> Optional[AdaptiveCard]:
+    return create_card(action.data or {})
+
+
+def build_message_details_card(action: MessagingExtensionAction) -> Optional[AdaptiveCard]:
+    return create_message_details_card(action.message_payload) if action.message_payload else None
+
+
+SubmitCardBuilder = Callable[[MessagingExtensionAction], Optional[AdaptiveCard]]
+
+# Card builders by message extension command ID
+SUBMIT_CARD_BUILDERS: Dict[str, SubmitCardBuilder] = {
+    "createCard": build_created_card,
+    "getMessageDetails": build_message_details_card,
+}
+
+
 @app.on_message_ext_submit
 async def handle_message_ext_submit(ctx: ActivityContext[MessageExtensionSubmitActionInvokeActivity]):
     command_id = ctx.activity.value.command_id
 
-    if command_id == "createCard":
-        card = create_card(ctx.activity.value.data or {})
-    elif command_id == "getMessageDetails" and ctx.activity.value.message_payload:
-        card = create_message_details_card(ctx.activity.value.message_payload)
-    else:
+    build_card = SUBMIT_CARD_BUILDERS.get(command_id or "")
+    card = build_card(ctx.activity.value) if build_card else None
+    if card is None:
         raise Exception(f"Unknown commandId: {command_id}")
 
-    main_attachment = card_attachment(AdaptiveCardAttachment(content=card))
-    attachment = MessagingExtensionAttachment(
-        content_type=main_attachment.content_type, content=main_attachment.content
-    )
+    attachment = MessagingExtensionAttachment(content_type=ADAPTIVE_CARD_CONTENT_TYPE, content=card)
 
     result = MessagingExtensionResult(
         type=MessagingExtensionResultType.RESULT,
@@ -130,7 +176,7 @@ async def handle_message_ext_open(ctx: ActivityContext[MessageExtensionFetchTask
         title="Conversation members",
         height="small",
         width="small",
-        card=card_attachment(AdaptiveCardAttachment(content=card)),
+        card=Attachment(content_type=ADAPTIVE_CARD_CONTENT_TYPE, content=card),
     )
 
     task = TaskModuleContinueResponse(value=card_info)
@@ -146,18 +192,10 @@ async def handle_message_ext_query(ctx: ActivityContext[MessageExtensionQueryInv
         search_query = ctx.activity.value.parameters[0].value or ""
 
     if command_id == "searchQuery":
-        cards = await create_dummy_cards(search_query)
-        attachments: list[MessagingExtensionAttachment] = []
-        for card_data in cards:
-            main_attachment = card_attachment(AdaptiveCardAttachment(content=card_data["card"]))
-            preview_attachment = card_attachment(
-                ThumbnailCardAttachment(content=ThumbnailCard(**card_data["thumbnail"]))
-            )
-
-            attachment = MessagingExtensionAttachment(
-                content_type=main_attachment.content_type, content=main_attachment.content, preview=preview_attachment
-            )
-            attachments.append(attachment)
+        attachments = [
+            create_search_attachment(create_query_search_result(search_query)),
+            *STATIC_SEARCH_ATTACHMENTS,
+        ]
 
         result = MessagingExtensionResult(
             type=MessagingExtensionResultType.RESULT,
@@ -172,16 +210,12 @@ async def handle_message_ext_query(ctx: ActivityContext[MessageExtensionQueryInv
 
 @app.on_message_ext_select_item
 async def handle_message_ext_select_item(ctx: ActivityContext[MessageExtensionSelectItemInvokeActivity]):
-    option = getattr(ctx.activity.value, "option", None)
+    # The selected item's value is the free-form payload set on the result, parsed as a dict
+    value = ctx.activity.value
+    option = cast(Dict[str, Any], value).get("option") if isinstance(value, dict) else None
     await ctx.send(f"Selected item: {option}")
 
-    result = MessagingExtensionResult(
-        type=MessagingExtensionResultType.RESULT,
-        attachment_layout=MessagingExtensionAttachmentLayout.LIST,
-        attachments=[],
-    )
-
-    return MessagingExtensionInvokeResponse(compose_extension=result)
+    return EMPTY_RESULT_RESPONSE
 
 
 @app.on_message_ext_query_settings_url
@@ -189,12 +223,10 @@ async def handle_message_ext_query_settings_url(ctx: ActivityContext[MessageExte
     user_settings = {"selectedOption": ""}
     escaped_selected_option = user_settings["selectedOption"]
 
-    bot_endpoint = os.environ.get("BOT_ENDPOINT", "")
-
     settings_action = CardAction(
         type=CardActionType.OPEN_URL,
         title="Settings",
-        value=f"{bot_endpoint}/tabs/settings?selectedOption={escaped_selected_option}",
+        value=f"{SETTINGS_URL}?selectedOption={escaped_selected_option}",
     )
 
     suggested_actions = MessagingExtensionSuggestedAction(actions=[settings_action])
@@ -206,42 +238,26 @@ async def handle_message_ext_query_settings_url(ctx: ActivityContext[MessageExte
 
 @app.on_message_ext_setting
 async def handle_message_ext_setting(ctx: ActivityContext[MessageExtensionSettingInvokeActivity]):
-    state = getattr(ctx.activity.value, "state", None)
+    state = ctx.activity.value.state
 
     if state == "CancelledByUser":
-        result = MessagingExtensionResult(
-            type=MessagingExtensionResultType.RESULT,
-            attachment_layout=MessagingExtensionAttachmentLayout.LIST,
-            attachments=[],
-        )
-        return MessagingExtensionInvokeResponse(compose_extension=result)
+        return EMPTY_RESULT_RESPONSE
 
     selected_option = state
     await ctx.send(f"Selected option: {selected_option}")
 
-    result = MessagingExtensionResult(
-        type=MessagingExtensionResultType.RESULT,
-        attachment_layout=MessagingExtensionAttachmentLayout.LIST,
-        attachments=[],
-    )
-
-    return MessagingExtensionInvokeResponse(compose_extension=result)
+    return EMPTY_RESULT_RESPONSE
 
 
 @app.on_config_open
 async def handle_config_open(ctx: ActivityContext[ConfigFetchInvokeActivity]):
-    bot_endpoint = os.environ.get("BOT_ENDPOINT", "")
-
-    return ConfigInvokeResponse(
-        config=TaskModuleContinueResponse(value=UrlTaskModuleTaskInfo(url=f"{bot_endpoint}/tabs/settings"))
-    )
+    return CONFIG_OPEN_RESPONSE
 
 
 @app.on_config_submit
 async def handle_config_submit(ctx: ActivityContext[ConfigSubmitInvokeActivity]):
     value = ctx.activity.value
-    assert isinstance(value, dict), "ConfigSubmitInvokeActivity value must be a dictionary"
-    state = cast(Dict[str, Any], value).get("data", None)
+    state = cast(Dict[str, Any], value).get("data") if isinstance(value, dict) else None
 
     return ConfigInvokeResponse(config=TaskModuleMessageResponse(value=f"Configuration saved with value: {state}"))
 
@@ -250,4 +266,4 @@ app.page("settings", str(Path(__file__).parent), "/tabs/settings")
 
 
 if __name__ == "__main__":
-    asyncio.run(app.start())
+    asyncio.run(app.start(), loop_factory=loop_factory)
@@ -9,6 +9,11 @@ from random import random
 from microsoft.teams.api import MessageActivity
 from microsoft.teams.apps import ActivityContext, App
 
+try:
+    from uvloop import new_event_loop as loop_factory
+except ImportError:  # uvloop is unavailable on Windows
+    loop_factory = None
+
 app = App()
 
 # List of sample messages to emit
@@ -42,4 +47,4 @@ async def handle_message(ctx: ActivityContext[MessageActivity]):
 
 
 if __name__ == "__main__":
-    asyncio.run(app.start())
+    asyncio.run(app.start(), loop_factory=loop_factory)
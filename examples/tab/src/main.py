@@ -10,6 +10,11 @@ from typing import Any
 from microsoft.teams.apps import App, FunctionContext
 from microsoft.teams.devtools import DevToolsPlugin
 
+try:
+    from uvloop import new_event_loop as loop_factory
+except ImportError:  # uvloop is unavailable on Windows
+    loop_factory = None
+
 app = App(plugins=[DevToolsPlugin()])
 app.tab("test", str(Path("Web/dist").resolve()))
 
@@ -24,4 +29,4 @@ async def post_to_chat(ctx: FunctionContext[Any]):
 
 
 if __name__ == "__main__":
-    asyncio.run(app.start())
+    asyncio.run(app.start(), loop_factory=loop_factory)
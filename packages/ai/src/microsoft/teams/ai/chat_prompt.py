@@ -14,11 +14,22 @@ from .ai_model import AIModel
 from .function import Function, FunctionHandler, FunctionHandlers, FunctionHandlerWithNoParams
 from .memory import Memory
 from .message import Message, ModelMessage, SystemMessage, UserMessage
-from .plugin import AIPluginProtocol
+from .plugin import AIPluginProtocol, BaseAIPlugin
 
 T = TypeVar("T", bound=BaseModel)
 
 
+def _overrides_hook(plugin: AIPluginProtocol, hook: str) -> bool:
+    """
+    Check whether a plugin replaces one of BaseAIPlugin's no-op hooks.
+
+    Hooks inherited unchanged from BaseAIPlugin return their input as-is,
+    so they can be skipped without changing the result. The hook is resolved
+    on the instance, so hooks assigned directly to a plugin are honored.
+    """
+    return getattr(getattr(plugin, hook, None), "__func__", None) is not getattr(BaseAIPlugin, hook)
+
+
 @dataclass
 class ChatSendResult:
     """
@@ -61,6 +72,10 @@ class ChatPrompt:
         self.functions: dict[str, Function[Any]] = {func.name: func for func in functions} if functions else {}
         self.plugins: list[AIPluginProtocol] = plugins or []
 
+        # Plugins overriding each hook, indexed from a snapshot of the plugin list on first dispatch
+        self._indexed_plugins: list[AIPluginProtocol] | None = None
+        self._plugins_by_hook: dict[str, list[AIPluginProtocol]] = {}
+
     @overload
     def with_function(self, function: Function[T]) -> Self: ...
 
@@ -211,7 +226,7 @@ class ChatPrompt:
 
         async def wrapped_handler(params: Optional[BaseModel]) -> str:
             # Run before function call hooks
-            for plugin in self.plugins:
+            for plugin in self._plugins_with_hook("on_before_function_call"):
                 await plugin.on_before_function_call(function_name, params)
 
             if params:
@@ -229,7 +244,7 @@ class ChatPrompt:
 
             # Run after function call hooks
             current_result = result
-            for plugin in self.plugins:
+            for plugin in self._plugins_with_hook("on_after_function_call"):
                 plugin_result = await plugin.on_after_function_call(function_name, current_result, params)
                 if plugin_result is not None:
                     current_result = plugin_result
@@ -241,6 +256,27 @@ class ChatPrompt:
 
         return wrapped_handler
 
+    def _plugins_with_hook(self, hook: str) -> list[AIPluginProtocol]:
+        """
+        Get the plugins whose implementation of a hook needs to be awaited.
+
+        Args:
+            hook: Name of the plugin hook method
+
+        Returns:
+            Plugins in registration order, excluding those using BaseAIPlugin's no-op default
+        """
+        # The plugin list is public, so it is compared against the indexed snapshot rather than
+        # relying on with_plugin to invalidate the index
+        if self._indexed_plugins != self.plugins:
+            self._indexed_plugins = list(self.plugins)
+            self._plugins_by_hook = {}
+
+        plugins = self._plugins_by_hook.get(hook)
+        if plugins is None:
+            plugins = self._plugins_by_hook[hook] = [plugin for plugin in self.plugins if _overrides_hook(plugin, hook)]
+        return plugins
+
     async def _run_before_send_hooks(self, input: Message) -> Message:
         """
         Execute before-send hooks from all plugins.
@@ -252,7 +288,7 @@ class ChatPrompt:
             Modified input message after plugin processing
         """
         current_input = input
-        for plugin in self.plugins:
+        for plugin in self._plugins_with_hook("on_before_send"):
             plugin_result = await plugin.on_before_send(current_input)
             if plugin_result is not None:
                 current_input = plugin_result
@@ -269,7 +305,7 @@ class ChatPrompt:
             Modified system instructions after plugin processing
         """
         current_instructions = instructions
-        for plugin in self.plugins:
+        for plugin in self._plugins_with_hook("on_build_instructions"):
             plugin_result = await plugin.on_build_instructions(current_instructions)
             if plugin_result is not None:
                 current_instructions = plugin_result
@@ -283,15 +319,16 @@ class ChatPrompt:
             Dictionary of functions with wrapped handlers, or None if no functions
         """
         functions_list = list(self.functions.values()) if self.functions else []
-        for plugin in self.plugins:
+        for plugin in self._plugins_with_hook("on_build_functions"):
             plugin_result = await plugin.on_build_functions(functions_list)
             if plugin_result is not None:
                 functions_list = plugin_result
 
-        wrapped_functions: dict[str, Function[BaseModel]] | None = None
-        wrapped_functions = {}
+        # Function is constructed unsubscripted: calling through the Function[BaseModel] alias
+        # costs about four times as much per wrapped function on every send
+        wrapped_functions: dict[str, Function[BaseModel]] = {}
         for func in functions_list:
-            wrapped_functions[func.name] = Function[BaseModel](
+            wrapped_functions[func.name] = Function(
                 name=func.name,
                 description=func.description,
                 parameter_schema=func.parameter_schema,
@@ -311,7 +348,7 @@ class ChatPrompt:
             Modified response after plugin processing
         """
         current_response = response
-        for plugin in self.plugins:
+        for plugin in self._plugins_with_hook("on_after_send"):
             plugin_result = await plugin.on_after_send(current_response)
             if plugin_result is not None:
                 current_response = plugin_result
@@ -688,6 +688,39 @@ class TestChatPromptPlugins:
         result2 = await prompt_with_func.send("Test with function")
         assert result2.response.content == "GENERATED - Test with function"
 
+    def test_inherited_default_hooks_are_skipped(self, mock_model: MockAIModel) -> None:
+        """Test that only hooks a plugin overrides are dispatched, in registration order"""
+
+        class BeforeSendPlugin(BaseAIPlugin):
+            async def on_before_send(self, input: Message) -> Message | None:
+                return input
+
+        before_send_plugin = BeforeSendPlugin("before_send")
+        full_plugin = MockPlugin("full")
+        prompt = ChatPrompt(mock_model, plugins=[BaseAIPlugin("base"), before_send_plugin, full_plugin])
+
+        assert prompt._plugins_with_hook("on_before_send") == [before_send_plugin, full_plugin]
+        assert prompt._plugins_with_hook("on_after_send") == [full_plugin]
+
+        # Plugins added later, through with_plugin or the list itself, are picked up
+        added_plugin = MockPlugin("added")
+        prompt.plugins.append(added_plugin)
+        assert prompt._plugins_with_hook("on_after_send") == [full_plugin, added_plugin]
+
+    @pytest.mark.asyncio
+    async def test_hook_assigned_on_instance_is_dispatched(self, mock_model: MockAIModel) -> None:
+        """Test that a hook assigned directly to a BaseAIPlugin instance still runs"""
+        plugin = BaseAIPlugin("instance")
+
+        async def on_before_send(input: Message) -> Message | None:
+            return UserMessage(content=f"INSTANCE: {input.content}")
+
+        plugin.on_before_send = on_before_send
+        prompt = ChatPrompt(mock_model, plugins=[plugin])
+
+        result = await prompt.send("Original")
+        assert result.response.content == "GENERATED - INSTANCE: Original"
+
     @pytest.mark.asyncio
     async def test_comprehensive_plugin_behavior_verification(self, mock_function_handler: Mock) -> None:
         """Comprehensive test verifying all plugin methods actually modify data passed to model"""
@@ -12,6 +12,10 @@ from ...models import Account
 from ..api_client_settings import ApiClientSettings
 from ..base_client import BaseClient
 
+# Activities are serialized with pydantic's model_dump_json, which is faster than dumping to a
+# dict and letting httpx encode it, so the content type is set explicitly
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class ConversationActivityClient(BaseClient):
     """
@@ -49,7 +53,8 @@ class ConversationActivityClient(BaseClient):
 
         response = await self.http.post(
             f"{self.service_url}/v3/conversations/{conversation_id}/activities",
-            json=activity.model_dump(by_alias=True, exclude_none=True),
+            content=activity.model_dump_json(by_alias=True, exclude_none=True),
+            headers=JSON_HEADERS,
         )
 
         # Note: Typing activities (non-streaming) always produce empty responses.
@@ -72,7 +77,8 @@ class ConversationActivityClient(BaseClient):
         """
         response = await self.http.put(
             f"{self.service_url}/v3/conversations/{conversation_id}/activities/{activity_id}",
-            json=activity.model_dump(by_alias=True),
+            content=activity.model_dump_json(by_alias=True),
+            headers=JSON_HEADERS,
         )
         id = response.json()["id"]
         return SentActivity(id=id, activity_params=activity)
@@ -4,6 +4,9 @@ Licensed under the MIT License.
 """
 # pyright: basic
 
+import json
+
+import httpx
 import pytest
 from microsoft.teams.api.clients.conversation import ConversationClient
 from microsoft.teams.api.clients.conversation.params import (
@@ -123,6 +126,26 @@ class TestConversationActivityOperations:
 
         assert result is not None
 
+    async def test_activity_create_sends_json_body(self, mock_activity):
+        """Test that a created activity is sent as a JSON body."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"id": "sent_activity_id"})
+
+        http_client = Client(ClientOptions())
+        http_client.http._transport = httpx.MockTransport(handler)
+        client = ConversationClient("https://test.service.url", http_client)
+
+        result = await client.activities("test_conversation_id").create(mock_activity)
+
+        assert result.id == "sent_activity_id"
+        assert requests[0].headers["content-type"] == "application/json"
+        assert json.loads(requests[0].content) == mock_activity.model_dump(
+            mode="json", by_alias=True, exclude_none=True
+        )
+
     async def test_activity_update(self, mock_http_client, mock_activity):
         """Test updating an activity."""
         service_url = "https://test.service.url"
@@ -54,10 +54,25 @@ class ActivityProcessor:
         self.token_manager = token_manager
         self.api_client_settings = api_client_settings
 
+        # API clients by service URL, so every activity from a service reuses one connection pool
+        self._api_clients: Dict[str, ApiClient] = {}
+
         # This will be set after the EventManager is initialized due to
         # a circular dependency
         self.event_manager: Optional["EventManager"] = None
 
+    def _get_api_client(self, service_url: str) -> ApiClient:
+        """Get the API client for a service URL, creating it on first use."""
+        api_client = self._api_clients.get(service_url)
+        if api_client is None:
+            api_client = ApiClient(
+                service_url,
+                self.http_client.clone(ClientOptions(token=self.token_manager.get_bot_token)),
+                self.api_client_settings,
+            )
+            self._api_clients[service_url] = api_client
+        return api_client
+
     async def _build_context(
         self,
         activity: ActivityBase,
@@ -84,11 +99,7 @@ class ActivityProcessor:
             locale=activity.locale,
             user=activity.from_,
         )
-        api_client = ApiClient(
-            service_url,
-            self.http_client.clone(ClientOptions(token=self.token_manager.get_bot_token)),
-            self.api_client_settings,
-        )
+        api_client = self._get_api_client(service_url)
 
         # Check if user is signed in
         is_signed_in = False
@@ -18,7 +18,6 @@ from typing import (
     Dict,
     Optional,
     TypedDict,
-    Union,
     Unpack,
     cast,
 )
@@ -40,6 +39,7 @@ from microsoft.teams.apps.http_stream import HttpStream
 from microsoft.teams.common.http import Client, ClientOptions, Token
 from microsoft.teams.common.logging import ConsoleLogger
 from pydantic import BaseModel, ValidationError
+from pydantic_core import to_json
 from starlette.applications import Starlette
 from starlette.types import Lifespan
 
@@ -113,6 +113,9 @@ class HttpPlugin(Sender):
         # Storage for pending HTTP responses by activity ID
         self.pending: Dict[str, asyncio.Future[Any]] = {}
 
+        # API clients by service URL, kept so outbound sends reuse pooled connections
+        self._api_clients: Dict[str, ApiClient] = {}
+
         # Setup FastAPI app with lifespan
         @asynccontextmanager
         async def default_lifespan(_app: Starlette) -> AsyncGenerator[None, None]:
@@ -266,8 +269,16 @@ class HttpPlugin(Sender):
         else:
             self.logger.error(f"Plugin error: {error}")
 
+    def _get_api_client(self, service_url: str) -> ApiClient:
+        """Get the API client for a service URL, creating it on first use."""
+        api = self._api_clients.get(service_url)
+        if api is None:
+            api = ApiClient(service_url=service_url, options=self.client.clone(ClientOptions(token=self.bot_token)))
+            self._api_clients[service_url] = api
+        return api
+
     async def send(self, activity: ActivityParams, ref: ConversationReference) -> SentActivity:
-        api = ApiClient(service_url=ref.service_url, options=self.client.clone(ClientOptions(token=self.bot_token)))
+        api = self._get_api_client(ref.service_url)
 
         activity.from_ = ref.bot
         activity.conversation = ref.conversation
@@ -361,7 +372,7 @@ class HttpPlugin(Sender):
 
         return result
 
-    def _handle_activity_response(self, response: Response, result: Any) -> Union[Response, Dict[str, object]]:
+    def _handle_activity_response(self, response: Response, result: Any) -> Response:
         """
         Handle the activity response formatting.
 
@@ -391,8 +402,15 @@ class HttpPlugin(Sender):
             response.status_code = status_code
 
         if body is not None:
-            self.logger.debug(f"Returning body {body}")
-            return body
+            self.logger.debug("Returning body %s", body)
+            # Serialize with pydantic-core rather than FastAPI's recursive jsonable_encoder,
+            # which dominates the cost of large invoke responses like card search results
+            json_response = Response(
+                content=to_json(body), status_code=response.status_code, media_type="application/json"
+            )
+            # Keep headers and cookies set on the injected response, as FastAPI does for bodies it encodes itself
+            json_response.headers.raw.extend(response.headers.raw)
+            return json_response
         self.logger.debug("Returning empty body")
         return response
 
@@ -416,9 +434,7 @@ class HttpPlugin(Sender):
     def create_stream(self, ref: ConversationReference) -> StreamerProtocol:
         """Create a new streaming instance."""
 
-        api = ApiClient(ref.service_url, self.client.clone(ClientOptions(token=self.bot_token)))
-
-        return HttpStream(api, ref, self.logger)
+        return HttpStream(self._get_api_client(ref.service_url), ref, self.logger)
 
     def mount(self, name: str, dir_path: Path | str, page_path: Optional[str] = None) -> None:
         """
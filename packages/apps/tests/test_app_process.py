@@ -6,14 +6,22 @@ Licensed under the MIT License.
 
 from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
-from microsoft.teams.api import Activity, ActivityBase, ConversationReference
+from microsoft.teams.api import (
+    Activity,
+    ActivityBase,
+    ConversationAccount,
+    ConversationReference,
+    MessageActivity,
+    TokenProtocol,
+)
 from microsoft.teams.apps import ActivityContext, Sender
 from microsoft.teams.apps.app_events import EventManager
 from microsoft.teams.apps.app_process import ActivityProcessor
 from microsoft.teams.apps.routing.router import ActivityHandler, ActivityRouter
 from microsoft.teams.apps.token_manager import TokenManager
-from microsoft.teams.common import Client, ConsoleLogger, LocalStorage
+from microsoft.teams.common import Client, ClientOptions, ConsoleLogger, LocalStorage
 
 
 class TestActivityProcessor:
@@ -89,3 +97,40 @@ class TestActivityProcessor:
         handler_one.assert_called_once_with(context)
         handler_two.assert_called_once_with(context)
         assert response == "handler_one"
+
+    @pytest.mark.asyncio
+    async def test_activities_from_same_service_share_api_client(self, mock_account):
+        """Test that activities from one service URL reuse a single API client and connection pool."""
+        transport = httpx.MockTransport(lambda request: httpx.Response(404))
+        http_client = Client(ClientOptions(transport=transport))
+        processor = ActivityProcessor(
+            MagicMock(spec=ActivityRouter),
+            MagicMock(),
+            "id",
+            MagicMock(spec=LocalStorage),
+            "default_connection",
+            http_client,
+            MagicMock(spec=TokenManager),
+            None,
+        )
+
+        def build_activity(activity_id: str, service_url: str) -> MessageActivity:
+            return MessageActivity(
+                id=activity_id,
+                text="hi",
+                from_=mock_account,
+                recipient=mock_account,
+                conversation=ConversationAccount(id="conv-1", conversation_type="personal"),
+                channel_id="msteams",
+                service_url=service_url,
+            )
+
+        token = MagicMock(spec=TokenProtocol)
+        sender = MagicMock(spec=Sender)
+        first = await processor._build_context(build_activity("1", "https://service.one"), token, [], sender)
+        second = await processor._build_context(build_activity("2", "https://service.one"), token, [], sender)
+        other = await processor._build_context(build_activity("3", "https://service.two"), token, [], sender)
+
+        assert first.api is second.api
+        assert first.api.http.http is second.api.http.http
+        assert other.api is not first.api
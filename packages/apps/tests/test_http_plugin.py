@@ -5,10 +5,12 @@ Licensed under the MIT License.
 # pyright: basic
 
 import asyncio
+import json
 from typing import cast
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from fastapi import Response
 from microsoft.teams.api import (
     Account,
     ConfigResponse,
@@ -190,6 +192,49 @@ class TestHttpPlugin:
         # Should not raise exception
         await plugin_with_validator.on_error(PluginErrorEvent(sender=plugin_with_validator, error=error))
 
+    def test_api_client_reused_per_service_url(self, plugin_with_validator, mock_account):
+        """Test that sends and streams to the same service URL share one API client."""
+        plugin_with_validator.client = MagicMock()
+        plugin_with_validator.bot_token = None
+        ref = ConversationReference(
+            service_url="https://service.one",
+            bot=mock_account,
+            channel_id="msteams",
+            conversation=ConversationAccount(id="conv-1", conversation_type="personal"),
+        )
+        other_ref = ref.model_copy(update={"service_url": "https://service.two"})
+
+        with patch(
+            "microsoft.teams.apps.http_plugin.ApiClient", side_effect=lambda **_: MagicMock()
+        ) as mock_api_client:
+            first = plugin_with_validator._get_api_client(ref.service_url)
+            stream = plugin_with_validator.create_stream(ref)
+            other = plugin_with_validator._get_api_client(other_ref.service_url)
+
+        assert first is plugin_with_validator._get_api_client(ref.service_url)
+        assert stream._client is first
+        assert other is not first
+        assert mock_api_client.call_count == 2
+        assert plugin_with_validator.client.clone.call_count == 2
+
+    def test_activity_response_serializes_invoke_body(self, plugin_with_validator):
+        """Test that an invoke response body is returned as JSON with the invoke status."""
+        result = InvokeResponse(body=cast(ConfigResponse, {"status": "success", "items": [1, None]}), status=201)
+
+        injected = Response()
+        del injected.headers["content-length"]
+        injected.headers["X-Custom"] = "kept"
+        injected.set_cookie("session", "abc")
+
+        response = plugin_with_validator._handle_activity_response(injected, result)
+
+        assert response.status_code == 201
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == {"status": "success", "items": [1, None]}
+        assert response.headers["x-custom"] == "kept"
+        assert "session=abc" in response.headers["set-cookie"]
+        assert response.headers["content-length"] == str(len(response.body))
+
     @pytest.mark.asyncio
     async def test_on_start_success(self, plugin_with_validator):
         """Test successful server startup."""
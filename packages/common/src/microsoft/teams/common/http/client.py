@@ -43,6 +43,19 @@ def _wrap_response_json(response: httpx.Response, logger: logging.Logger) -> Non
     response.json = safe_json
 
 
+class _BorrowedTransport(httpx.AsyncBaseTransport):
+    """Transport shared from another client, left open when the borrowing client is closed."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
 @dataclass(frozen=True)
 class ClientOptions:
     """
@@ -55,6 +68,8 @@ class ClientOptions:
         logger: Logger instance for request/response/error logging.
         token: Default authorization token (string, string-like, or callable).
         interceptors: List of interceptors for request/response middleware.
+        transport: HTTP transport that owns the connection pool. When set, clones share it without closing it.
+            When unset, httpx creates its own transport, honoring proxy environment variables.
     """
 
     base_url: Optional[str] = None
@@ -63,6 +78,7 @@ class ClientOptions:
     logger: Optional[logging.Logger] = None
     token: Optional[Token] = None
     interceptors: Optional[List[Interceptor]] = field(default_factory=list[Interceptor])
+    transport: Optional[httpx.AsyncBaseTransport] = None
 
 
 class Client:
@@ -94,10 +110,12 @@ class Client:
         # Maintain interceptors as a separate instance attribute (do not mutate options)
         self._interceptors = list(options.interceptors or [])
 
+        # A transport is only passed when one was given, since httpx skips proxy environment variables otherwise
         self.http = httpx.AsyncClient(
             base_url=httpx.URL(options.base_url) if options.base_url else "",
             headers=options.headers,
             timeout=options.timeout,
+            transport=options.transport,
         )
         self._update_event_hooks()
 
@@ -423,8 +441,17 @@ class Client:
 
         Returns:
             A new Client instance with merged options and a cloned interceptor list.
+            If this client was given a transport, the clone shares it but never closes it.
         """
         overrides = overrides or ClientOptions()
+        if overrides.transport is not None:
+            transport = overrides.transport
+        elif self._options.transport is not None:
+            # The clone borrows this client's transport, so closing the clone leaves it open
+            transport = _BorrowedTransport(self._options.transport)
+        else:
+            transport = None
+
         merged_options = ClientOptions(
             base_url=overrides.base_url if overrides.base_url is not None else self._options.base_url,
             headers={**self._options.headers, **(overrides.headers or {})},
@@ -434,5 +461,6 @@ class Client:
             interceptors=list(overrides.interceptors)
             if overrides.interceptors is not None
             else list(self._interceptors),
+            transport=transport,
         )
         return Client(merged_options)
@@ -119,6 +119,44 @@ async def test_clone_merges_options_and_interceptors(mock_transport):
     assert interceptor2.request_called
 
 
+@pytest.mark.asyncio
+async def test_clone_shares_transport(mock_transport):
+    client = Client(ClientOptions(base_url="https://example.com", transport=mock_transport))
+
+    clone = client.clone(ClientOptions(headers={"X-Clone": "bar"}))
+
+    assert clone.http is not client.http
+    resp = await clone.get("/clone")
+    assert resp.status_code == 200
+    assert resp.json()["headers"]["x-clone"] == "bar"
+
+
+@pytest.mark.asyncio
+async def test_closing_clone_leaves_shared_transport_open():
+    class TrackingTransport(httpx.MockTransport):
+        closed = False
+
+        async def aclose(self):
+            self.closed = True
+
+    transport = TrackingTransport(lambda request: httpx.Response(200))
+    client = Client(ClientOptions(base_url="https://example.com", transport=transport))
+
+    await client.clone().http.aclose()
+
+    assert not transport.closed
+    assert (await client.get("/after-clone-closed")).status_code == 200
+
+
+def test_client_without_transport_honors_proxy_env(monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example.com:8080")
+
+    client = Client(ClientOptions(base_url="https://example.com"))
+
+    assert client.http._mounts
+    assert client.clone().http._mounts
+
+
 @pytest.mark.parametrize(
     "token,expected",
     [
@@ -4,9 +4,10 @@ Licensed under the MIT License.
 """
 
 from .auth_provider import AuthProvider
-from .graph import get_graph_client
+from .graph import create_graph_http_client, get_graph_client
 
 __all__ = [
     "AuthProvider",
+    "create_graph_http_client",
     "get_graph_client",
 ]
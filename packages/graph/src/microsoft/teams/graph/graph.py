@@ -3,22 +3,61 @@ Copyright (c) Microsoft Corporation. All rights reserved.
 Licensed under the MIT License.
 """
 
-from typing import Optional
+from typing import Dict, Optional, cast
 
+import httpx
 from azure.core.exceptions import ClientAuthenticationError
+from kiota_abstractions.request_option import RequestOption
+from kiota_authentication_azure.azure_identity_authentication_provider import AzureIdentityAuthenticationProvider
+from kiota_http.kiota_client_factory import DEFAULT_CONNECTION_TIMEOUT, DEFAULT_REQUEST_TIMEOUT
 from microsoft.teams.common.http.client_token import Token
+from msgraph.graph_request_adapter import GraphRequestAdapter
+from msgraph.graph_request_adapter import options as graph_middleware_options
 from msgraph.graph_service_client import GraphServiceClient
+from msgraph_core import GraphClientFactory  # type: ignore
 
 from .auth_provider import AuthProvider
 
+GRAPH_BASE_URL = "https://graph.microsoft.com/v1.0"
 
-def get_graph_client(token: Optional[Token] = None) -> GraphServiceClient:
+
+def create_graph_http_client(limits: Optional[httpx.Limits] = None) -> httpx.AsyncClient:
+    """
+    Create an HTTP/2 client with the Graph middleware pipeline that can be shared across Graph clients.
+
+    By default each Graph client opens its own connection pool. Passing one shared client to
+    get_graph_client lets requests for different users reuse warm connections.
+    The caller owns the client and should close it with `aclose()` on shutdown.
+
+    Args:
+        limits: Optional connection pool limits. Defaults to httpx's limits.
+            Timeouts match the Graph SDK's default client.
+
+    Returns:
+        httpx.AsyncClient: A client configured for Microsoft Graph v1.0
+    """
+    client = httpx.AsyncClient(
+        base_url=GRAPH_BASE_URL,
+        http2=True,
+        limits=limits or httpx.Limits(),
+        timeout=httpx.Timeout(DEFAULT_REQUEST_TIMEOUT, connect=DEFAULT_CONNECTION_TIMEOUT),
+    )
+    return GraphClientFactory.create_with_default_middleware(
+        client=client, options=cast(Dict[str, RequestOption], graph_middleware_options)
+    )
+
+
+def get_graph_client(
+    token: Optional[Token] = None, http_client: Optional[httpx.AsyncClient] = None
+) -> GraphServiceClient:
     """
     Get a configured Microsoft Graph client using a Token.
 
     Args:
         token: Token data (string, StringLike, callable, or None). If None,
                will raise ClientAuthenticationError with a clear message.
+        http_client: Optional shared HTTP client from create_graph_http_client. If None,
+               the Graph client opens its own connection pool.
 
     Returns:
         GraphServiceClient: A configured client ready for Microsoft Graph API calls
@@ -53,8 +92,11 @@ def get_graph_client(token: Optional[Token] = None) -> GraphServiceClient:
             )
 
         credential = AuthProvider(token)
-        client = GraphServiceClient(credentials=credential)
-        return client
+        if http_client is None:
+            return GraphServiceClient(credentials=credential)
+
+        request_adapter = GraphRequestAdapter(AzureIdentityAuthenticationProvider(credential), client=http_client)
+        return GraphServiceClient(request_adapter=request_adapter)
 
     except Exception as e:
         if isinstance(e, ClientAuthenticationError):
@@ -10,7 +10,7 @@ import jwt
 import pytest
 from azure.core.credentials import AccessToken
 from azure.core.exceptions import ClientAuthenticationError
-from microsoft.teams.graph import get_graph_client
+from microsoft.teams.graph import create_graph_http_client, get_graph_client
 from microsoft.teams.graph.auth_provider import AuthProvider
 from msgraph.graph_service_client import GraphServiceClient
 
@@ -290,3 +290,18 @@ class TestGraphClientFactory:
         credential = AuthProvider(failing_token)
         with pytest.raises(ClientAuthenticationError):
             credential.get_token("https://graph.microsoft.com/.default")
+
+    def test_get_graph_client_with_shared_http_client(self) -> None:
+        """Test that Graph clients built with a shared HTTP client send requests through it."""
+
+        # Arrange
+        http_client = create_graph_http_client()
+
+        # Act
+        first = get_graph_client("first_token", http_client=http_client)
+        second = get_graph_client("second_token", http_client=http_client)
+
+        # Assert
+        assert first.request_adapter._http_client is http_client  # type: ignore
+        assert second.request_adapter._http_client is http_client  # type: ignore
+        assert str(http_client.base_url) == "https://graph.microsoft.com/v1.0/"
@@ -6,7 +6,7 @@ Licensed under the MIT License.
 import importlib.metadata
 import logging
 from inspect import isawaitable
-from typing import Annotated, Any, TypeVar, cast
+from typing import Annotated, Any, Sequence, TypeVar, cast
 
 from fastmcp import FastMCP
 from fastmcp.tools import FunctionTool
@@ -142,6 +142,20 @@ class McpServerPlugin(PluginBase):
             self.logger.error(f"Failed to register function '{function.name}' as MCP tool: {e}")
             raise
 
+    def use_tools(self, functions: Sequence[Function[Any]]) -> "McpServerPlugin":
+        """
+        Add several AI functions as MCP tools in one call.
+
+        Args:
+            functions: The AI functions to register as MCP tools
+
+        Returns:
+            Self for method chaining
+        """
+        for function in functions:
+            self.use_tool(function)
+        return self
+
     async def on_start(self, event: PluginStartEvent) -> None:
         """
         Start the plugin - mount MCP server on HTTP plugin.
@@ -0,0 +1,59 @@
+"""
+Copyright (c) Microsoft Corporation. All rights reserved.
+Licensed under the MIT License.
+"""
+
+from typing import Any, List
+
+import pytest
+from fastmcp import Client
+from microsoft.teams.ai import Function
+from microsoft.teams.mcpplugin import McpServerPlugin
+from pydantic import BaseModel
+
+# pyright: basic
+
+
+class EchoParams(BaseModel):
+    text: str
+
+
+def create_functions() -> List[Function[Any]]:
+    return [
+        Function(name="echo", description="Echo the text back", parameter_schema=EchoParams, handler=lambda p: p.text),
+        Function(name="ping", description="Reply with pong", parameter_schema=None, handler=lambda: "pong"),
+    ]
+
+
+class TestMcpServerPluginUseTools:
+    """Test cases for registering several AI functions at once."""
+
+    @pytest.mark.asyncio
+    async def test_use_tools_registers_each_function_like_use_tool(self):
+        """Test that use_tools exposes the same tools as calling use_tool for each function."""
+        plugin = McpServerPlugin()
+        single_plugin = McpServerPlugin()
+
+        result = plugin.use_tools(create_functions())
+        for function in create_functions():
+            single_plugin.use_tool(function)
+
+        assert result is plugin
+        tools = await plugin.server.get_tools()
+        single_tools = await single_plugin.server.get_tools()
+        assert set(tools) == {"echo", "ping"}
+        for name, tool in tools.items():
+            assert tool.description == single_tools[name].description
+            assert tool.parameters == single_tools[name].parameters
+
+    @pytest.mark.asyncio
+    async def test_use_tools_functions_are_callable(self):
+        """Test that every function registered through use_tools can be called by an MCP client."""
+        plugin = McpServerPlugin().use_tools(create_functions())
+
+        async with Client(plugin.server) as client:
+            echo_result = await client.call_tool("echo", {"text": "hello"})
+            ping_result = await client.call_tool("ping", {})
+
+        assert echo_result.content[0].text == "hello"
+        assert ping_result.content[0].text == "pong"